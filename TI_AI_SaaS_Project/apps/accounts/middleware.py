@@ -6,21 +6,28 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Path prefixes as tuples so a single str.startswith() call can test them all
+ACTIVITY_TRACKING_PATHS = (
+    '/api/accounts/auth/users/me/',  # User profile endpoint
+    '/api/analysis/',  # Analysis endpoints
+    '/dashboard/',  # Dashboard pages
+)
+
+RBAC_PROTECTED_PATHS = (
+    '/api/analysis/',  # Dashboard and analysis endpoints
+    '/dashboard/',     # Dashboard views
+)
+
 
 class SessionTimeoutMiddleware(MiddlewareMixin):
     """
     Middleware to handle access token expiry after 26 minutes of inactivity
     """
     def process_request(self, request):
-        # Define paths that should trigger activity tracking
-        activity_tracking_paths = [
-            '/api/accounts/auth/users/me/',  # User profile endpoint
-            '/api/analysis/',  # Analysis endpoints
-            '/dashboard/',  # Dashboard pages
-        ]
-        # Check if the user is authenticated and the path requires activity tracking
-        if (request.user.is_authenticated and
-            any(request.path.startswith(path) for path in activity_tracking_paths)):
+        # Check the path first so untracked requests never load request.user,
+        # then whether the user is authenticated
+        if (request.path.startswith(ACTIVITY_TRACKING_PATHS) and
+            request.user.is_authenticated):
             # Check if the user's access token has expired due to inactivity (26 minutes)
             try:
                 if is_user_session_expired(request.user.id):
@@ -49,39 +56,32 @@ class RBACMiddleware(MiddlewareMixin):
     Role-Based Access Control middleware to enforce user permissions
     """
     def process_request(self, request):
-        # Define protected paths that require specific roles
-        protected_paths = [
-            '/api/analysis/',  # Dashboard and analysis endpoints
-            '/dashboard/',     # Dashboard views
-        ]
-
         # Check if the requested path is protected
-        for path in protected_paths:
-            if request.path.startswith(path):
-                # If user is not authenticated, deny access
-                if not request.user.is_authenticated:
-                    return JsonResponse(
-                        {'error': 'Authentication required'},
-                        status=401
-                    )
+        if request.path.startswith(RBAC_PROTECTED_PATHS):
+            # If user is not authenticated, deny access
+            if not request.user.is_authenticated:
+                return JsonResponse(
+                    {'error': 'Authentication required'},
+                    status=401
+                )
 
-                # Check if user has appropriate role/permission
-                # For this application, we require the user to be a Talent Acquisition Specialist
-                # which is indicated by the profile field 'is_talent_acquisition_specialist'
-                try:
-                    profile = request.user.profile
-                except (AttributeError, ObjectDoesNotExist):
-                    # This occurs when the profile relation doesn't exist
-                    logger.debug(f"Profile for user {request.user.id if hasattr(request.user, 'id') else 'unknown'} does not exist")
-                    return JsonResponse(
-                        {'error': 'User profile not found'},
-                        status=403
-                    )
+            # Check if user has appropriate role/permission
+            # For this application, we require the user to be a Talent Acquisition Specialist
+            # which is indicated by the profile field 'is_talent_acquisition_specialist'
+            try:
+                profile = request.user.profile
+            except (AttributeError, ObjectDoesNotExist):
+                # This occurs when the profile relation doesn't exist
+                logger.debug(f"Profile for user {request.user.id if hasattr(request.user, 'id') else 'unknown'} does not exist")
+                return JsonResponse(
+                    {'error': 'User profile not found'},
+                    status=403
+                )
 
-                if not profile.is_talent_acquisition_specialist:
-                    return JsonResponse(
-                        {'error': 'Insufficient permissions'},
-                        status=403
-                    )
+            if not profile.is_talent_acquisition_specialist:
+                return JsonResponse(
+                    {'error': 'Insufficient permissions'},
+                    status=403
+                )
 
         return None  # Continue with the request
\ No newline at end of file
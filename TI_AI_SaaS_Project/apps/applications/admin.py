@@ -3,7 +3,9 @@ Admin interface for Applications app
 """
 
 from django.contrib import admin
+from django.db.models.functions import Substr
 from apps.applications.models import Applicant, ApplicationAnswer
+from apps.applications.tasks import queue_confirmation_emails
 
 
 @admin.register(Applicant)
@@ -19,6 +21,8 @@ class ApplicantAdmin(admin.ModelAdmin):
         'submitted_at',
         'status'
     ]
+
+    list_select_related = ['job_listing']
     
     list_filter = [
         'status',
@@ -39,6 +43,7 @@ class ApplicantAdmin(admin.ModelAdmin):
         'submitted_at',
         'resume_file_hash',
         'resume_parsed_text',
+        'parse_status',
         'status'
     ]
     
@@ -50,7 +55,7 @@ class ApplicantAdmin(admin.ModelAdmin):
             'fields': ('job_listing', 'status')
         }),
         ('Resume', {
-            'fields': ('resume_file', 'resume_file_hash', 'resume_parsed_text')
+            'fields': ('resume_file', 'resume_file_hash', 'parse_status', 'resume_parsed_text')
         }),
         ('Metadata', {
             'fields': ('id', 'submitted_at'),
@@ -61,6 +66,21 @@ class ApplicantAdmin(admin.ModelAdmin):
     date_hierarchy = 'submitted_at'
     ordering = ['-submitted_at']
 
+    actions = ['send_missing_confirmation_emails']
+
+    def get_queryset(self, request):
+        """Leave the parsed resume text out of list queries; the change form loads it on access."""
+        return super().get_queryset(request).defer('resume_parsed_text')
+
+    @admin.action(description='Send missing confirmation emails')
+    def send_missing_confirmation_emails(self, request, queryset):
+        """Queue confirmation emails in batches for selected applicants that never received one."""
+        applicant_ids = list(
+            queryset.filter(confirmation_sent_at__isnull=True).values_list('id', flat=True)
+        )
+        queue_confirmation_emails(applicant_ids)
+        self.message_user(request, f"Queued confirmation emails for {len(applicant_ids)} applicant(s).")
+
 
 @admin.register(ApplicationAnswer)
 class ApplicationAnswerAdmin(admin.ModelAdmin):
@@ -69,9 +89,12 @@ class ApplicationAnswerAdmin(admin.ModelAdmin):
     list_display = [
         'applicant',
         'question',
-        'answer_text',
+        'answer_preview',
         'created_at'
     ]
+
+    # Applicant and question both render their job listing title in __str__
+    list_select_related = ['applicant__job_listing', 'question__job_listing']
     
     list_filter = [
         'created_at',
@@ -100,3 +123,14 @@ class ApplicationAnswerAdmin(admin.ModelAdmin):
     
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
+
+    def get_queryset(self, request):
+        """Fetch only a truncated answer for the changelist instead of the full text."""
+        return super().get_queryset(request).defer('answer_text').annotate(
+            answer_preview=Substr('answer_text', 1, 80)
+        )
+
+    def answer_preview(self, obj):
+        """Get the first 80 characters of the answer."""
+        return obj.answer_preview
+    answer_preview.short_description = 'Answer'
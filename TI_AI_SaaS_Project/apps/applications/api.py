@@ -18,14 +18,14 @@ from apps.applications.throttles import (
     ApplicationSubmissionIPThrottle,
     ApplicationValidationIPThrottle,
 )
+from apps.applications.utils.file_validation import MAGIC_BYTES_LENGTH
 from apps.applications.serializers import (
     ApplicantSerializer,
-    ApplicantCreateResponseSerializer,
     FileValidationRequestSerializer,
     ContactValidationRequestSerializer,
 )
 from services.duplication_service import DuplicationService
-from apps.applications.tasks import send_application_confirmation_email
+from apps.applications.tasks import send_application_confirmation_email, parse_and_redact_resume
 from services.resume_parsing_service import ResumeParserService
 
 logger = logging.getLogger(__name__)
@@ -59,28 +59,23 @@ def submit_application(request):
     phone = serializer.validated_data.get('phone')
     resume = serializer.validated_data.get('resume')
 
-    # Check for duplicates (email, phone, or resume)
+    # Check for duplicates (email, phone, or resume) in a single query
     # Use generic response to prevent information disclosure about which field is duplicated
     has_duplicate = False
-    
-    if job_listing and email:
-        email_duplicate = DuplicationService.check_email_duplicate(job_listing, email)
-        if email_duplicate:
-            has_duplicate = True
-
-    if job_listing and phone and not has_duplicate:
-        phone_duplicate = DuplicationService.check_phone_duplicate(job_listing, phone)
-        if phone_duplicate:
-            has_duplicate = True
+    file_hash = None
 
-    if job_listing and resume and not has_duplicate:
+    if job_listing and resume:
         # Calculate file hash for duplicate check
-        file_content = resume.read()
-        resume.seek(0)
-        file_hash = ResumeParserService.calculate_file_hash(file_content)
-        resume_duplicate = DuplicationService.check_resume_duplicate(job_listing, file_hash)
-        if resume_duplicate:
-            has_duplicate = True
+        file_hash = ResumeParserService.calculate_uploaded_file_hash(resume)
+
+    if job_listing:
+        duplicates = DuplicationService.check_duplicates_bulk(
+            job_listing,
+            email=email,
+            phone=phone,
+            file_hash=file_hash
+        )
+        has_duplicate = any(duplicates.values())
 
     if has_duplicate:
         # Return generic error message to prevent information disclosure
@@ -105,7 +100,8 @@ def submit_application(request):
     # DB-level unique constraints will catch concurrent duplicate submissions
     try:
         with transaction.atomic():
-            applicant = serializer.save()
+            # Hand the already computed hash over so create() doesn't rehash
+            applicant = serializer.save(resume_file_hash=file_hash)
     except IntegrityError as e:
         # Handle database constraint violations from concurrent submissions
         # Return generic error to prevent information disclosure about which field
@@ -127,17 +123,25 @@ def submit_application(request):
             status=status.HTTP_409_CONFLICT
         )
 
-    # Send confirmation email asynchronously
-    send_application_confirmation_email.delay(str(applicant.id))
+    # Parse the resume and send the confirmation email asynchronously once
+    # the applicant row is committed, so a rolled-back outer transaction
+    # never queues work for a missing applicant
+    transaction.on_commit(
+        lambda applicant_id=str(applicant.id): parse_and_redact_resume.delay(applicant_id)
+    )
+    transaction.on_commit(
+        lambda applicant_id=str(applicant.id): send_application_confirmation_email.delay(applicant_id)
+    )
 
-    # Return success response with access token for secure redirect
-    response_data = ApplicantCreateResponseSerializer({
-        'id': applicant.id,
+    # Return success response with access token for secure redirect.
+    # The JSON renderer encodes the datetime, so no serializer pass is needed.
+    response_data = {
+        'id': str(applicant.id),
         'status': applicant.status,
         'submitted_at': applicant.submitted_at,
         'access_token': str(applicant.access_token),
         'message': f"Application submitted successfully. A confirmation email has been sent to {applicant.email}"
-    }).data
+    }
 
     return Response(response_data, status=status.HTTP_201_CREATED)
 
@@ -168,12 +172,13 @@ def validate_file(request):
     job_listing = serializer.validated_data['job_listing_id']
     resume_file = serializer.validated_data['resume']
     
-    # Read file content
-    file_content = resume_file.read()
+    # Validate size, format and magic bytes from the header only, so invalid
+    # uploads are rejected before the whole file is read into memory
+    header = resume_file.read(MAGIC_BYTES_LENGTH)
     resume_file.seek(0)
-    
-    # Validate file
-    validation_result = DuplicationService.validate_resume_file(file_content, resume_file.name)
+    validation_result = DuplicationService.validate_resume_header(
+        header, resume_file.name, resume_file.size
+    )
     
     if not validation_result['valid']:
         return Response(
@@ -185,9 +190,11 @@ def validate_file(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Check for duplicate resume
-    file_hash = validation_result['file_hash']
-    is_duplicate = DuplicationService.check_resume_duplicate(job_listing, file_hash)
+    # Hash the upload for the duplicate check
+    file_hash = ResumeParserService.calculate_uploaded_file_hash(resume_file)
+
+    # Check for duplicate resume (negative outcomes are briefly cached)
+    is_duplicate = DuplicationService.check_duplicates_cached(job_listing, file_hash=file_hash)
     
     if is_duplicate:
         return Response(
@@ -213,7 +220,7 @@ def validate_file(request):
     return Response(
         {
             'valid': True,
-            'file_size': len(file_content),
+            'file_size': resume_file.size,
             'file_format': validation_result['file_extension'],
             'checks': {
                 'format_valid': True,
@@ -253,11 +260,12 @@ def validate_contact(request):
     email = serializer.validated_data['email']
     phone = serializer.validated_data['phone']
 
-    # Check for duplicates
-    email_duplicate = DuplicationService.check_email_duplicate(job_listing, email)
-    phone_duplicate = DuplicationService.check_phone_duplicate(job_listing, phone)
+    # Check for duplicates. "Not a duplicate" outcomes are cached briefly so
+    # repeated validations (field blur, retries) don't hit the database each
+    # time; submit_application re-checks uncached on save.
+    has_duplicate = DuplicationService.check_duplicates_cached(job_listing, email=email, phone=phone)
 
-    if email_duplicate or phone_duplicate:
+    if has_duplicate:
         # Return generic error message to prevent information disclosure
         # about which specific field is duplicated
         return Response(
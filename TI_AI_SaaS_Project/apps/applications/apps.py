@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class ApplicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.applications'
\ No newline at end of file
+    name = 'apps.applications'
+
+    def ready(self):
+        # Register signal handlers
+        from apps.applications import signals  # noqa: F401
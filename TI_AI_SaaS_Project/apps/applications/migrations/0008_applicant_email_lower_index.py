@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-17 14:24
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_auto_20260222_2228'),
+        ('jobs', '0002_alter_joblisting_description_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(models.F('job_listing'), django.db.models.functions.text.Lower('email'), name='app_job_email_lower_idx'),
+        ),
+    ]
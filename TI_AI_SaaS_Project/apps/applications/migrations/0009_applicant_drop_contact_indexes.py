@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-17 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_applicant_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicant',
+            name='email',
+            field=models.EmailField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='applicant',
+            name='phone',
+            field=models.CharField(max_length=50),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_applicant_drop_contact_indexes'),
+    ]
+
+    operations = [
+        # Existing applicants were parsed synchronously on submission
+        migrations.AddField(
+            model_name='applicant',
+            name='parse_status',
+            field=models.CharField(choices=[('pending', 'pending'), ('parsed', 'parsed'), ('failed', 'failed')], default='parsed', editable=False, help_text='Progress of the background resume text extraction', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='applicant',
+            name='parse_status',
+            field=models.CharField(choices=[('pending', 'pending'), ('parsed', 'parsed'), ('failed', 'failed')], default='pending', editable=False, help_text='Progress of the background resume text extraction', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_applicant_parse_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicant',
+            name='resume_file_hash',
+            field=models.CharField(max_length=64),
+        ),
+    ]
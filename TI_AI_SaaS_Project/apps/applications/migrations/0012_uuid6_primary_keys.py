@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:26
+
+import uuid6
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_applicant_drop_resume_hash_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicant',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid6, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='applicationanswer',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid6, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
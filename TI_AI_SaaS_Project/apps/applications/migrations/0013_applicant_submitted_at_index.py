@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_uuid6_primary_keys'),
+        ('jobs', '0002_alter_joblisting_description_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['submitted_at'], name='application_submitt_df5116_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_applicant_submitted_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='confirmation_sent_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the confirmation email was sent; guards against duplicate sends', null=True),
+        ),
+    ]
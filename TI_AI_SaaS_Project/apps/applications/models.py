@@ -1,17 +1,28 @@
 import uuid
-from django.db import models, IntegrityError
+from uuid6 import uuid6
+from django.db import models, IntegrityError, transaction
+from django.db.models.functions import Lower
 import secrets
 import string
 
 
+REFERENCE_NUMBER_CHARS = string.digits + string.ascii_uppercase
+REFERENCE_NUMBER_LENGTH = 6
+
+
 def generate_reference_number():
     """
     Generate a unique reference number for applications.
     Format: XC-XXXXXX (XC- followed by 6 alphanumeric characters)
+
+    Draws a single random number below 36^6 and encodes it in base 36.
     """
-    chars = string.ascii_uppercase + string.digits
-    random_part = ''.join(secrets.choice(chars) for _ in range(6))
-    return f'XC-{random_part}'
+    value = secrets.randbelow(len(REFERENCE_NUMBER_CHARS) ** REFERENCE_NUMBER_LENGTH)
+    random_part = []
+    for _ in range(REFERENCE_NUMBER_LENGTH):
+        value, index = divmod(value, len(REFERENCE_NUMBER_CHARS))
+        random_part.append(REFERENCE_NUMBER_CHARS[index])
+    return f"XC-{''.join(random_part)}"
 
 
 class Applicant(models.Model):
@@ -26,7 +37,16 @@ class Applicant(models.Model):
         (STATUS_SUBMITTED, 'submitted'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    PARSE_STATUS_PENDING = 'pending'
+    PARSE_STATUS_PARSED = 'parsed'
+    PARSE_STATUS_FAILED = 'failed'
+    PARSE_STATUS_CHOICES = [
+        (PARSE_STATUS_PENDING, 'pending'),
+        (PARSE_STATUS_PARSED, 'parsed'),
+        (PARSE_STATUS_FAILED, 'failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid6, editable=False)  # Time-ordered UUIDv6 keeps PK inserts sequential
     reference_number = models.CharField(
         max_length=20,
         unique=True,
@@ -46,15 +66,28 @@ class Applicant(models.Model):
     )
     first_name = models.CharField(max_length=200)
     last_name = models.CharField(max_length=200)
-    email = models.EmailField(max_length=255, db_index=True)
-    phone = models.CharField(max_length=50, db_index=True)
+    email = models.EmailField(max_length=255)
+    phone = models.CharField(max_length=50)
     resume_file = models.FileField(
         upload_to='applications/resumes/',
         max_length=500
     )
-    resume_file_hash = models.CharField(max_length=64, db_index=True)
+    resume_file_hash = models.CharField(max_length=64)
     resume_parsed_text = models.TextField()
+    parse_status = models.CharField(
+        max_length=20,
+        choices=PARSE_STATUS_CHOICES,
+        default=PARSE_STATUS_PENDING,
+        editable=False,
+        help_text="Progress of the background resume text extraction"
+    )
     submitted_at = models.DateTimeField(auto_now_add=True)
+    confirmation_sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When the confirmation email was sent; guards against duplicate sends"
+    )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -79,14 +112,25 @@ class Applicant(models.Model):
         ]
         indexes = [
             models.Index(fields=['job_listing', 'submitted_at']),
+            # Serves the retention cleanup's submitted_at range filter across all jobs
+            models.Index(fields=['submitted_at']),
+            # Serves the case-insensitive email duplicate check
+            models.Index('job_listing', Lower('email'), name='app_job_email_lower_idx'),
         ]
     
     def save(self, *args, **kwargs):
         """
         Auto-generate reference_number and access_token if not set.
         
-        Retries up to 5 times if reference_number collision occurs.
+        Retries up to 5 times if reference_number collision occurs. Each
+        attempt runs in its own savepoint so a collision inside an outer
+        transaction can be retried instead of breaking it. Updates of an
+        existing row skip generation and retries and save directly.
         """
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
         max_attempts = 5
         last_error = None
         
@@ -101,13 +145,18 @@ class Applicant(models.Model):
                     self.access_token = uuid.uuid4()
                 
                 # Save the model
-                super().save(*args, **kwargs)
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
                 return  # Success - exit the method
                 
             except IntegrityError as e:
-                # Check if this is specifically a reference_number uniqueness error
-                error_message = str(e).lower()
-                if 'reference_number' in error_message:
+                # Check if this is specifically a reference_number uniqueness
+                # error by probing for the value, since error messages differ
+                # per database backend. Only runs after a failed INSERT.
+                reference_taken = Applicant.objects.filter(
+                    reference_number=self.reference_number
+                ).exists()
+                if reference_taken:
                     # Store the error for potential re-raise
                     last_error = e
                     # Clear reference_number to force regeneration on next attempt
@@ -126,7 +175,13 @@ class Applicant(models.Model):
             ) from last_error
 
     def __str__(self):
-        return f"{self.first_name} {self.last_name} - {self.job_listing.title}"
+        # Use the title only when the job listing is already loaded, so listing
+        # or logging applicants never triggers a lazy query per row
+        if Applicant.job_listing.is_cached(self):
+            job = self.job_listing.title
+        else:
+            job = f"Job {self.job_listing_id}"
+        return f"{self.first_name} {self.last_name} - {job}"
 
 
 class ApplicationAnswer(models.Model):
@@ -136,7 +191,7 @@ class ApplicationAnswer(models.Model):
     References ScreeningQuestion from jobs app to avoid duplication.
     """
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid6, editable=False)  # Time-ordered UUIDv6 keeps PK inserts sequential
     applicant = models.ForeignKey(
         'Applicant',
         on_delete=models.CASCADE,
@@ -162,4 +217,4 @@ class ApplicationAnswer(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.applicant} - Answer to Question {self.question.id}"
+        return f"{self.applicant} - Answer to Question {self.question_id}"
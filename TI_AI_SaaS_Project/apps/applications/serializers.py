@@ -1,14 +1,37 @@
+import copy
+import json
+import uuid
+from django.db import transaction
 from rest_framework import serializers
-from pathlib import Path
 from apps.applications.models import Applicant, ApplicationAnswer
 from apps.jobs.models import ScreeningQuestion, JobListing
 from apps.applications.utils.file_validation import validate_resume_file
 from apps.applications.utils.email_validation import validate_email
 from apps.applications.utils.phone_validation import validate_phone
-from services.resume_parsing_service import ResumeParserService, ConfidentialInfoFilter
+from services.resume_parsing_service import ResumeParserService
 
 
-class ScreeningQuestionSerializer(serializers.ModelSerializer):
+# Fields built from each serializer's Meta, keyed by serializer class
+_FIELDS_CACHE = {}
+
+
+class CachedFieldsMixin:
+    """
+    Mixin that builds ModelSerializer fields once per class.
+
+    Introspecting the model for every instance is repeated work on each request, so the
+    built fields are cached and deep-copied per instance (DRF clones fields from their
+    constructor arguments, so every serializer still binds its own field objects).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super().get_fields()
+        return copy.deepcopy(_FIELDS_CACHE[cls])
+
+
+class ScreeningQuestionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for ScreeningQuestion model (read-only)."""
     
     class Meta:
@@ -17,7 +40,7 @@ class ScreeningQuestionSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ApplicationAnswerSerializer(serializers.ModelSerializer):
+class ApplicationAnswerSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for ApplicationAnswer model."""
 
     question_id = serializers.UUIDField(write_only=True)
@@ -29,6 +52,14 @@ class ApplicationAnswerSerializer(serializers.ModelSerializer):
 
     def validate_question_id(self, value):
         """Validate that the question exists."""
+        # Prefer the questions the parent serializer loaded in bulk
+        questions_by_id = self.context.get('questions_by_id')
+        if questions_by_id is not None:
+            question = questions_by_id.get(value)
+            if question is None:
+                raise serializers.ValidationError("Question not found.")
+            return question
+
         try:
             question = ScreeningQuestion.objects.get(id=value)
             return question
@@ -63,7 +94,7 @@ class ApplicationAnswerSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class ApplicantSerializer(serializers.ModelSerializer):
+class ApplicantSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Applicant model with file upload and validation."""
 
     job_listing_id = serializers.UUIDField(write_only=True)
@@ -84,43 +115,44 @@ class ApplicantSerializer(serializers.ModelSerializer):
         """Parse JSON strings for screening_answers field (from multipart forms)."""
         if 'screening_answers' in data and isinstance(data['screening_answers'], str):
             try:
-                import json
-                data = data.copy()
-                data['screening_answers'] = json.loads(data['screening_answers'])
+                screening_answers = json.loads(data['screening_answers'])
             except (json.JSONDecodeError, ValueError) as e:
                 raise serializers.ValidationError({
                     'screening_answers': f'Invalid JSON format: {str(e)}'
                 })
-        
-        # Manually validate nested screening_answers serializer
-        validated_screening_answers = []
+            # Copy into a plain dict so the nested field validates the decoded list
+            # directly instead of parsing multipart form data as HTML list input
+            data = {key: data[key] for key in data}
+            data['screening_answers'] = screening_answers
+
         if 'screening_answers' in data and isinstance(data['screening_answers'], list):
-            data = data.copy()
-            answer_serializer = ApplicationAnswerSerializer(many=True, data=data['screening_answers'])
-            if answer_serializer.is_valid():
-                validated_screening_answers = answer_serializer.validated_data
-            else:
-                raise serializers.ValidationError({
-                    'screening_answers': answer_serializer.errors
-                })
-        
-        # Call parent to_internal_value to validate other fields
-        result = super().to_internal_value(data)
-        
-        # Manually add the validated screening answers to the result
-        # This is needed because DRF doesn't automatically handle nested serializers
-        # for write-only fields that aren't on the model
-        if hasattr(result, '_dict'):
-            result._dict['screening_answers'] = validated_screening_answers
-        elif isinstance(result, dict):
-            result['screening_answers'] = validated_screening_answers
-        
-        return result
-    
+            # Resolve every referenced question in one query instead of one per answer
+            self.context['questions_by_id'] = self._load_questions(data['screening_answers'])
+
+        # The declared screening_answers field validates the answers exactly once
+        return super().to_internal_value(data)
+
+    @staticmethod
+    def _load_questions(screening_answers):
+        """Fetch the screening questions referenced by raw answer data, keyed by id."""
+        question_ids = set()
+        for answer in screening_answers:
+            if not isinstance(answer, dict):
+                continue
+            try:
+                question_ids.add(uuid.UUID(str(answer.get('question_id'))))
+            except ValueError:
+                # Malformed ids are reported by the question_id field itself
+                continue
+        if not question_ids:
+            return {}
+        return ScreeningQuestion.objects.in_bulk(question_ids)
+
     def validate_job_listing_id(self, value):
         """Validate that the job listing exists and is active."""
         try:
-            job_listing = JobListing.objects.get(id=value)
+            # Screening questions are prefetched here so validate() can reuse them
+            job_listing = JobListing.objects.prefetch_related('screening_questions').get(id=value)
             if job_listing.status != 'Active':
                 raise serializers.ValidationError("This job is no longer accepting applications.")
             return job_listing
@@ -138,10 +170,7 @@ class ApplicantSerializer(serializers.ModelSerializer):
     
     def validate_resume(self, value):
         """Validate resume file format and size."""
-        validated_file = validate_resume_file(value)
-        # Store the validated extension for use in create()
-        self.validated_file_extension = Path(value.name).suffix.lower().lstrip('.')
-        return validated_file
+        return validate_resume_file(value)
 
     def validate(self, attrs):
         """Validate cross-field dependencies (screening answers vs required questions)."""
@@ -151,117 +180,98 @@ class ApplicantSerializer(serializers.ModelSerializer):
         if not job_listing:
             return attrs
 
-        # Get all required questions for this job
-        required_questions = list(
-            ScreeningQuestion.objects.filter(
-                job_listing=job_listing,
-                required=True
-            ).values_list('id', flat=True)
-        )
+        # Map the job's questions to their required flag using the prefetched set
+        job_questions = {
+            question.id: question.required
+            for question in job_listing.screening_questions.all()
+        }
+        required_questions = {qid for qid, required in job_questions.items() if required}
 
         # If there are required questions, screening_answers must be present and non-empty
-        if required_questions:
-            if not screening_answers:
-                raise serializers.ValidationError({
-                    'screening_answers': 'This job listing has required screening questions that must be answered.'
-                })
+        if required_questions and not screening_answers:
+            raise serializers.ValidationError({
+                'screening_answers': 'This job listing has required screening questions that must be answered.'
+            })
+
+        # Extract question IDs from answers (handle both dict with object or id)
+        answered_question_ids = set()
+        for answer in screening_answers or []:
+            # Handle question_id as dict with 'id' key, object with 'id' attribute, or raw UUID
+            if isinstance(answer, dict):
+                qid = answer.get('question_id')
+                if isinstance(qid, dict) and 'id' in qid:
+                    qid = qid['id']
+                elif hasattr(qid, 'id'):
+                    qid = qid.id
+            elif hasattr(answer, 'question_id'):
+                qid = answer.question_id
+                if hasattr(qid, 'id'):
+                    qid = qid.id
+            else:
+                qid = answer
 
-            # Extract question IDs from answers (handle both dict with object or id)
-            answered_question_ids = set()
-            for answer in screening_answers:
-                # Handle question_id as dict with 'id' key, object with 'id' attribute, or raw UUID
-                if isinstance(answer, dict):
-                    qid = answer.get('question_id')
-                    if isinstance(qid, dict) and 'id' in qid:
-                        qid = qid['id']
-                    elif hasattr(qid, 'id'):
-                        qid = qid.id
-                elif hasattr(answer, 'question_id'):
-                    qid = answer.question_id
-                    if hasattr(qid, 'id'):
-                        qid = qid.id
-                else:
-                    qid = answer
-
-                # Verify the question belongs to this job_listing
-                if qid:
-                    if not ScreeningQuestion.objects.filter(id=qid, job_listing=job_listing).exists():
-                        raise serializers.ValidationError({
-                            'screening_answers': f'Question {qid} does not belong to this job listing or does not exist.'
-                        })
-                    answered_question_ids.add(qid)
-
-            # Check for missing required questions
-            missing_questions = set(required_questions) - answered_question_ids
-            if missing_questions:
-                raise serializers.ValidationError({
-                    'screening_answers': f'Missing required answers for questions: {missing_questions}'
-                })
+            # Verify the question belongs to this job_listing
+            if qid:
+                if qid not in job_questions:
+                    raise serializers.ValidationError({
+                        'screening_answers': f'Question {qid} does not belong to this job listing or does not exist.'
+                    })
+                answered_question_ids.add(qid)
+
+        # Check for missing required questions
+        missing_questions = required_questions - answered_question_ids
+        if missing_questions:
+            raise serializers.ValidationError({
+                'screening_answers': f'Missing required answers for questions: {missing_questions}'
+            })
 
         return attrs
 
     def create(self, validated_data):
         """Create applicant and answers."""
         # Get screening answers (may be empty list if no questions)
-        screening_answers = validated_data.pop('screening_answers', [])
-        job_listing = validated_data.pop('job_listing_id')
-        resume_file = validated_data.pop('resume')
-        # Remove country_code as it's write-only and not a model field
-        validated_data.pop('country_code', None)
-
-        # Calculate file hash for duplication detection
-        file_content = resume_file.read()
-        file_hash = ResumeParserService.calculate_file_hash(file_content)
-
-        # Extract and redact resume text using pre-validated extension
-        file_extension = self.validated_file_extension
-        if file_extension == 'pdf':
-            parsed_text = ResumeParserService.extract_text_from_pdf(file_content)
-        elif file_extension == 'docx':
-            parsed_text = ResumeParserService.extract_text_from_docx(file_content)
-        else:
-            # This should never happen due to validate_resume()
-            raise serializers.ValidationError("Unsupported file format.")
-
-        # Redact confidential information
-        redacted_text = ConfidentialInfoFilter.redact(parsed_text)
+        screening_answers = validated_data.get('screening_answers', [])
+        resume_file = validated_data['resume']
+
+        # Reuse the hash from the view's duplicate check when provided,
+        # otherwise stream the upload through the hash for duplication detection
+        file_hash = validated_data.get('resume_file_hash')
+        if file_hash is None:
+            file_hash = ResumeParserService.calculate_uploaded_file_hash(resume_file)
 
         # Reset file pointer to the beginning before saving
         resume_file.seek(0)
 
-        # Create applicant
-        applicant = Applicant.objects.create(
-            job_listing=job_listing,
-            resume_file_hash=file_hash,
-            resume_parsed_text=redacted_text,
-            **validated_data
-        )
-
-        # Save the resume file after creating the object
-        applicant.resume_file.save(resume_file.name, resume_file, save=True)
-
-        # Create answers for each screening question response
-        for answer_data in screening_answers:
-            question = answer_data['question_id']
-            answer_text = answer_data['answer_text']
-
-            ApplicationAnswer.objects.create(
-                applicant=applicant,
-                question=question,
-                answer_text=answer_text
+        # Create applicant, resume and answers together so a failure rolls back all of them.
+        # Resume text is extracted afterwards by the parse_and_redact_resume task.
+        with transaction.atomic():
+            # Model fields are listed explicitly so write-only inputs such as
+            # country_code never reach the model
+            applicant = Applicant.objects.create(
+                job_listing=validated_data['job_listing_id'],
+                first_name=validated_data['first_name'],
+                last_name=validated_data['last_name'],
+                email=validated_data['email'],
+                phone=validated_data['phone'],
+                resume_file_hash=file_hash,
+                resume_parsed_text=''
             )
 
-        return applicant
-
+            # Save the resume file after creating the object, updating only its column
+            applicant.resume_file.save(resume_file.name, resume_file, save=False)
+            applicant.save(update_fields=['resume_file'])
 
-class ApplicantCreateResponseSerializer(serializers.Serializer):
-    """Serializer for applicant creation response."""
+            # Create answers for all screening question responses in one INSERT
+            ApplicationAnswer.objects.bulk_create([
+                ApplicationAnswer(
+                    applicant=applicant,
+                    question=answer_data['question_id'],
+                    answer_text=answer_data['answer_text']
+                )
+                for answer_data in screening_answers
+            ])
 
-    id = serializers.UUIDField()
-    status = serializers.CharField()
-    submitted_at = serializers.DateTimeField()
-    access_token = serializers.UUIDField()
-    message = serializers.CharField()
+        return applicant
 
 
 class DuplicateCheckResponseSerializer(serializers.Serializer):
@@ -0,0 +1,18 @@
+"""
+Signal handlers for Applications app
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.applications.models import Applicant
+from services.duplication_service import DuplicationService
+
+
+@receiver(post_save, sender=Applicant)
+def invalidate_duplicate_cache(sender, instance, created, **kwargs):
+    """Clear cached "not a duplicate" outcomes once a new applicant is committed."""
+    if created:
+        # Invalidating before commit would let a concurrent check re-cache
+        # the negative while the row is still invisible to other connections
+        transaction.on_commit(lambda: DuplicationService.invalidate_duplicate_cache(instance))
@@ -2,18 +2,153 @@
 Celery tasks for the applications app.
 """
 
-from celery import shared_task
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from celery import group, shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
-from django.core.mail import EmailMultiAlternatives
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import models, transaction
 from django.template.loader import render_to_string
 from django.utils import timezone
 from datetime import timedelta
 from apps.applications.models import Applicant
+from services.resume_parsing_service import ResumeParserService, ConfidentialInfoFilter
 
 logger = get_task_logger(__name__)
 
+# Applicants per send_confirmation_emails_batch task for bulk resends
+CONFIRMATION_EMAIL_BATCH_SIZE = 50
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+# Batching and parallel storage deletes used by cleanup_expired_applications
+CLEANUP_BATCH_SIZE = 500
+CLEANUP_BATCH_DELAY = 0.1  # seconds between batches
+CLEANUP_DELETE_WORKERS = 16
+
+
+# SMTP connection kept open for the lifetime of a prefork worker process.
+# Set by worker_process_init; stays None in web processes and eager runs,
+# where each email opens its own connection.
+_worker_mail_connection = None
+
+
+@worker_process_init.connect
+def _open_worker_mail_connection(**kwargs):
+    """Create this worker process's persistent mail connection."""
+    global _worker_mail_connection
+    _worker_mail_connection = get_connection()
+
+
+@worker_process_shutdown.connect
+def _close_worker_mail_connection(**kwargs):
+    """Close the persistent mail connection when the worker process exits."""
+    if _worker_mail_connection is not None:
+        _worker_mail_connection.close()
+
+
+def _send_email(message: EmailMultiAlternatives):
+    """
+    Send an email over the worker's persistent connection when there is one.
+
+    Reusing the connection skips the SMTP TCP/TLS handshake per message. If the
+    server has dropped the idle connection, it is reopened once and the send retried.
+    """
+    connection = _worker_mail_connection
+    if connection is None:
+        message.send()
+        return
+
+    message.connection = connection
+    # A no-op while connected; reconnects after a previous close
+    connection.open()
+    try:
+        message.send()
+    except smtplib.SMTPServerDisconnected:
+        connection.close()
+        connection.open()
+        message.send()
+
+
+def _confirmation_email_queryset():
+    """
+    Applicants with only the columns the confirmation email renders.
+
+    The subject and templates use the job listing, so it is loaded in the same query.
+    """
+    return Applicant.objects.select_related('job_listing').only(
+        'id', 'first_name', 'last_name', 'email', 'submitted_at', 'reference_number',
+        'confirmation_sent_at', 'job_listing__title'
+    )
+
+
+def _build_confirmation_email(applicant, connection=None) -> EmailMultiAlternatives:
+    """
+    Render the confirmation email for an applicant.
+
+    Args:
+        applicant: Applicant loaded via _confirmation_email_queryset
+        connection: Optional mail connection to send the message through
+
+    Returns:
+        The email message with HTML and plain text versions
+    """
+    # Email subject
+    subject = f"Application Received - {applicant.job_listing.title}"
+
+    # Email context
+    context = {
+        'applicant': applicant,
+        'job_listing': applicant.job_listing,
+        'submitted_at': applicant.submitted_at,
+    }
+
+    # Render HTML and plain text versions
+    html_content = render_to_string(
+        'applications/emails/confirmation_email.html',
+        context
+    )
+    plain_content = render_to_string(
+        'applications/emails/confirmation_email.txt',
+        context
+    )
+
+    # Create email
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body=plain_content,
+        from_email='noreply@x-crewter.com',
+        to=[applicant.email],
+        connection=connection,
+    )
+    message.attach_alternative(html_content, 'text/html')
+    return message
+
+
+def _claim_confirmation(applicant_id) -> bool:
+    """
+    Atomically mark an applicant's confirmation email as sent.
+
+    The conditional UPDATE matches for exactly one caller, so of concurrent
+    tasks for the same applicant (double submits, redelivered messages) in
+    any worker process, only the one that claimed the row sends the email.
+
+    Returns:
+        True if this caller claimed the confirmation
+    """
+    return Applicant.objects.filter(
+        id=applicant_id, confirmation_sent_at__isnull=True
+    ).update(confirmation_sent_at=timezone.now()) == 1
+
+
+def _release_confirmation(applicant_id):
+    """Clear a claimed confirmation marker after a failed send so a retry can claim it."""
+    Applicant.objects.filter(id=applicant_id).update(confirmation_sent_at=None)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True)
 def send_application_confirmation_email(self, applicant_id: str):
     """
     Send confirmation email to applicant after successful submission.
@@ -21,43 +156,20 @@ def send_application_confirmation_email(self, applicant_id: str):
     Args:
         applicant_id: UUID of the applicant
     """
-    applicant = None
+    if not _claim_confirmation(applicant_id):
+        if Applicant.objects.filter(id=applicant_id).exists():
+            logger.info(f"Confirmation email already sent for application {applicant_id}")
+        else:
+            logger.error(f"Applicant {applicant_id} not found")
+        return
+
     email = "<unknown>"
     try:
-        applicant = Applicant.objects.get(id=applicant_id)
+        applicant = _confirmation_email_queryset().get(id=applicant_id)
         email = applicant.email
 
-        # Email subject
-        subject = f"Application Received - {applicant.job_listing.title}"
-
-        # Email context
-        context = {
-            'applicant': applicant,
-            'job_listing': applicant.job_listing,
-            'submitted_at': applicant.submitted_at,
-        }
-
-        # Render HTML and plain text versions
-        html_content = render_to_string(
-            'applications/emails/confirmation_email.html',
-            context
-        )
-        plain_content = render_to_string(
-            'applications/emails/confirmation_email.txt',
-            context
-        )
-
-        # Create email
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=plain_content,
-            from_email='noreply@x-crewter.com',
-            to=[applicant.email],
-        )
-        email.attach_alternative(html_content, 'text/html')
-
         # Send email
-        email.send()
+        _send_email(_build_confirmation_email(applicant))
 
         logger.info(f"Confirmation email sent for application {applicant_id}")
 
@@ -67,45 +179,244 @@ def send_application_confirmation_email(self, applicant_id: str):
         return
     except Exception as exc:
         logger.error(f"Failed to send email to {email} (applicant_id={applicant_id}): {exc}")
+        # Nothing was sent, so let the retry claim the confirmation again
+        _release_confirmation(applicant_id)
         # Retry with exponential backoff
         raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True)
+def send_confirmation_emails_batch(self, applicant_ids: list):
+    """
+    Send confirmation emails for several applicants over one mail connection.
+
+    Used for bulk sends through queue_confirmation_emails instead of one task
+    per applicant, which also saves an SMTP handshake per message. Each
+    applicant is claimed and sent on its own, so only delivered emails keep
+    their marker. If a send fails, the applicants not yet sent are retried.
+
+    Args:
+        applicant_ids: UUIDs of the applicants
+    """
+    applicants = list(_confirmation_email_queryset().filter(id__in=applicant_ids))
+
+    found_ids = {str(applicant.id) for applicant in applicants}
+    for applicant_id in applicant_ids:
+        if str(applicant_id) not in found_ids:
+            logger.error(f"Applicant {applicant_id} not found")
+
+    # Skip applicants whose confirmation has already gone out
+    applicants = [applicant for applicant in applicants if applicant.confirmation_sent_at is None]
+    if not applicants:
+        return
+
+    sent_count = 0
+    next_index = 0
+    connection = get_connection()
+    try:
+        # Open once up front; send() would otherwise reconnect for every message
+        connection.open()
+        for applicant in applicants:
+            if _claim_confirmation(applicant.id):
+                try:
+                    _build_confirmation_email(applicant, connection).send()
+                except Exception:
+                    _release_confirmation(applicant.id)
+                    raise
+                sent_count += 1
+            next_index += 1
+    except Exception as exc:
+        remaining_ids = [str(applicant.id) for applicant in applicants[next_index:]]
+        logger.error(
+            f"Failed to send confirmation emails, {len(remaining_ids)} of "
+            f"{len(applicants)} left to retry: {exc}"
+        )
+        # Retry with exponential backoff, resending only what did not go out
+        raise self.retry(args=[remaining_ids], exc=exc, countdown=60 * (2 ** self.request.retries))
+    finally:
+        connection.close()
+
+    logger.info(f"Confirmation emails sent for {sent_count} of {len(applicants)} applications")
+
+
+def queue_confirmation_emails(applicant_ids):
+    """
+    Enqueue confirmation emails for many applicants as batch tasks.
+
+    The batches are published together as one Celery group, so a bulk resend
+    costs one broker round trip per CONFIRMATION_EMAIL_BATCH_SIZE applicants.
+
+    Args:
+        applicant_ids: UUIDs of the applicants
+    """
+    applicant_ids = [str(applicant_id) for applicant_id in applicant_ids]
+    if not applicant_ids:
+        return
+    group(
+        send_confirmation_emails_batch.s(applicant_ids[start:start + CONFIRMATION_EMAIL_BATCH_SIZE])
+        for start in range(0, len(applicant_ids), CONFIRMATION_EMAIL_BATCH_SIZE)
+    ).apply_async()
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30, ignore_result=True)
+def parse_and_redact_resume(self, applicant_id: str):
+    """
+    Extract and redact the text of an applicant's stored resume.
+
+    Runs after submission so PDF/Docx parsing stays off the request path.
+    Stores the redacted text and marks parse_status parsed, or failed if
+    the file cannot be parsed. Storage I/O errors are retried with backoff
+    first and only mark the resume failed once the retries run out.
+
+    Args:
+        applicant_id: UUID of the applicant
+    """
+    try:
+        applicant = Applicant.objects.only('id', 'resume_file').get(id=applicant_id)
+    except Applicant.DoesNotExist:
+        logger.error(f"Applicant {applicant_id} not found")
+        return
+
+    file_extension = Path(applicant.resume_file.name).suffix.lower().lstrip('.')
+    try:
+        with applicant.resume_file.open('rb') as resume_file:
+            if file_extension == 'pdf':
+                parsed_text = ResumeParserService.extract_text_from_pdf(resume_file)
+            elif file_extension == 'docx':
+                parsed_text = ResumeParserService.extract_text_from_docx(resume_file)
+            else:
+                raise ValueError(f"Unsupported file format: {file_extension or '<none>'}")
+
+        # Redact confidential information
+        redacted_text = ConfidentialInfoFilter.redact(parsed_text)
+    except OSError as exc:
+        # Storage may be briefly unreachable; the file is likely readable later
+        if self.request.retries < self.max_retries:
+            logger.warning(f"Could not read resume for applicant {applicant_id}, retrying: {exc}")
+            raise self.retry(exc=exc, countdown=30 * (2 ** self.request.retries))
+        logger.error(f"Failed to read resume for applicant {applicant_id}: {exc}")
+        Applicant.objects.filter(id=applicant_id).update(
+            parse_status=Applicant.PARSE_STATUS_FAILED
+        )
+        return
+    except Exception as exc:
+        logger.error(f"Failed to parse resume for applicant {applicant_id}: {exc}")
+        Applicant.objects.filter(id=applicant_id).update(
+            parse_status=Applicant.PARSE_STATUS_FAILED
+        )
+        return
+
+    Applicant.objects.filter(id=applicant_id).update(
+        resume_parsed_text=redacted_text,
+        parse_status=Applicant.PARSE_STATUS_PARSED
+    )
+    logger.info(f"Parsed resume for application {applicant_id}")
+
+
 @shared_task
 def cleanup_expired_applications():
     """
     Delete applications older than 90 days per data retention policy.
     
-    This task:
-    1. Queries applications older than 90 days
-    2. Deletes associated files from storage
+    This task works through expired applications in id-ordered batches of
+    CLEANUP_BATCH_SIZE, so each transaction stays short however many rows expire.
+    For each batch it:
+    1. Queries ids and resume paths of the next batch of expired applications
+    2. Deletes those files from storage in parallel
     3. Deletes database records
-    4. Logs deletion count
+    Then logs the total deletion count.
     """
     expiry_date = timezone.now() - timedelta(days=90)
-    expired = Applicant.objects.filter(submitted_at__lt=expiry_date)
-    
-    count = expired.count()
-    
-    if count == 0:
-        logger.info("No expired applications to clean up")
-        return
-    
-    # Delete files from storage first
-    for applicant in expired:
+    expired = Applicant.objects.filter(submitted_at__lt=expiry_date).order_by('id')
+    raw_delete = settings.APPLICATIONS_CLEANUP_RAW_DELETE and _can_raw_delete_applicants()
+    storage = Applicant._meta.get_field('resume_file').storage
+
+    def delete_resume(path):
         try:
-            if applicant.resume_file:
-                applicant.resume_file.delete(save=False)
-                logger.debug(f"Deleted resume file for applicant {applicant.id}")
+            storage.delete(path)
+            logger.debug(f"Deleted resume file {path}")
         except Exception as e:
-            logger.error(f"Failed to delete file for applicant {applicant.id}: {e}")
-    
-    # Then delete records
-    deleted_count, _ = expired.delete()
-    
+            logger.error(f"Failed to delete resume file {path}: {e}")
+
+    deleted_count = 0
+    last_id = None
+    with ThreadPoolExecutor(max_workers=CLEANUP_DELETE_WORKERS) as executor:
+        while True:
+            # Keyset pagination: continue after the last id of the previous batch
+            batch_qs = expired if last_id is None else expired.filter(id__gt=last_id)
+            batch = list(batch_qs.values_list('id', 'resume_file')[:CLEANUP_BATCH_SIZE])
+            if not batch:
+                break
+            batch_ids = [applicant_id for applicant_id, _ in batch]
+            last_id = batch_ids[-1]
+
+            # Delete files from storage first, concurrently since each delete is I/O-bound
+            resume_paths = [path for _, path in batch if path]
+            list(executor.map(delete_resume, resume_paths))
+
+            # Then delete records
+            if raw_delete:
+                deleted_count += _raw_delete_applicants(batch_ids)
+            else:
+                # Collector-based delete, for installs that rely on delete signals
+                deleted_count += Applicant.objects.filter(id__in=batch_ids).delete()[1].get(
+                    Applicant._meta.label, 0
+                )
+
+            if len(batch) < CLEANUP_BATCH_SIZE:
+                break
+            # Yield to other database clients between batches
+            time.sleep(CLEANUP_BATCH_DELAY)
+
+    if deleted_count == 0:
+        logger.info("No expired applications to clean up")
+        return
+
     logger.info(f"Cleaned up {deleted_count} expired applications older than {expiry_date}")
 
 
+def _can_raw_delete_applicants() -> bool:
+    """
+    Return True if _raw_delete_applicants() removes exactly what QuerySet.delete() would.
+
+    That holds only while every relation to Applicant cascades and the related
+    models have no relations of their own. A SET_NULL/PROTECT relation or a
+    grandchild table needs the collector, so cleanup falls back to it.
+    """
+    for relation in Applicant._meta.related_objects:
+        if relation.on_delete is not models.CASCADE or relation.related_model._meta.related_objects:
+            logger.warning(
+                f"{relation.related_model._meta.label} cannot be raw-deleted with Applicant; "
+                f"using QuerySet.delete() for cleanup"
+            )
+            return False
+    return True
+
+
+def _raw_delete_applicants(applicant_ids) -> int:
+    """
+    Delete applicants and their dependent rows with plain DELETE statements.
+
+    QuerySet.delete() loads every applicant and cascaded row to send delete
+    signals; this skips that, so memory stays flat however many rows expire.
+    Callers must check _can_raw_delete_applicants() first. Children are
+    deleted first, then applicants.
+
+    Args:
+        applicant_ids: Primary keys of the applicants to delete
+
+    Returns:
+        Number of applicants deleted
+    """
+    applicants = Applicant.objects.filter(id__in=applicant_ids)
+    with transaction.atomic(using=applicants.db):
+        for relation in Applicant._meta.related_objects:
+            relation.related_model._base_manager.filter(**{
+                f'{relation.field.name}__in': applicant_ids
+            })._raw_delete(applicants.db)
+        return applicants._raw_delete(applicants.db)
+
+
 @shared_task
 def check_duplicate_resumes():
     """
@@ -116,18 +427,22 @@ def check_duplicate_resumes():
     """
     from django.db.models import Count
     
-    # Find job listings with potential duplicate resumes
-    duplicates = Applicant.objects.values('job_listing', 'resume_file_hash') \
+    # Find job listings with potential duplicate resumes. Rows without a hash
+    # are filtered out in SQL; the unique_resume_per_job index serves the grouping.
+    duplicates = Applicant.objects.exclude(resume_file_hash='') \
+        .values('job_listing', 'resume_file_hash') \
         .annotate(count=Count('id')) \
         .filter(count__gt=1)
-    
+
     if duplicates:
-        logger.warning(f"Found {len(duplicates)} potential duplicate resume groups")
-        # Log for manual review - actual deduplication should be handled manually
-        for dup in duplicates:
-            # Safely handle missing or None resume_file_hash
-            resume_hash = dup.get('resume_file_hash') or '<no_hash>'
-            logger.warning(
-                f"Job {dup['job_listing']}, Hash {resume_hash[:16] if resume_hash != '<no_hash>' else resume_hash}... "
-                f"has {dup['count']} submissions"
-            )
+        # Log for manual review in one record - actual deduplication should be handled manually
+        lines = [
+            f"Job {dup['job_listing']}, Hash {dup['resume_file_hash'][:16]}... "
+            f"has {dup['count']} submissions"
+            for dup in duplicates
+        ]
+        logger.warning(
+            "Found %d potential duplicate resume groups:\n%s",
+            len(lines),
+            "\n".join(lines)
+        )
@@ -3,6 +3,7 @@ Integration Tests for Email Delivery
 """
 
 from datetime import timedelta
+from unittest.mock import patch
 from django.utils import timezone
 from django.test import TestCase, Client
 from django.core import mail
@@ -140,6 +141,44 @@ class EmailDeliveryIntegrationTest(TestCase):
         applicant = Applicant.objects.get(email='jane.smith@gmail.com')
         self.assertEqual(applicant.job_listing, self.job_listing)
 
+    @patch('apps.applications.serializers.validate_email', side_effect=lambda email: email)
+    def test_email_queued_only_after_commit(self, mock_validate_email):
+        """Test the confirmation email task is dispatched on transaction commit"""
+        resume = self.create_valid_resume()
+
+        with patch('apps.applications.api.send_application_confirmation_email.delay') as mock_delay, \
+                patch('apps.applications.api.parse_and_redact_resume.delay') as mock_parse_delay:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = self.client.post(
+                    '/api/applications/',
+                    {
+                        'job_listing_id': str(self.job_listing.id),
+                        'first_name': 'Sam',
+                        'last_name': 'Lee',
+                        'email': 'sam.lee@gmail.com',
+                        'phone': '+12025557777',
+                        'country_code': 'US',
+                        'screening_answers': json.dumps([
+                            {
+                                'question_id': str(self.screening_question.id),
+                                'answer_text': 'I have 2 years of experience'
+                            }
+                        ]),
+                        'resume': resume
+                    },
+                    format='multipart'
+                )
+                # Nothing is queued until the transaction commits
+                mock_delay.assert_not_called()
+                mock_parse_delay.assert_not_called()
+
+        self.assertEqual(response.status_code, 201)
+        # Resume parsing, confirmation email and duplicate cache invalidation
+        self.assertEqual(len(callbacks), 3)
+        applicant = Applicant.objects.get(email='sam.lee@gmail.com')
+        mock_delay.assert_called_once_with(str(applicant.id))
+        mock_parse_delay.assert_called_once_with(str(applicant.id))
+
 
 if __name__ == '__main__':
     import unittest
@@ -4,11 +4,14 @@ Integration Tests for Application Submission Endpoint
 
 import json
 from datetime import timedelta
+from unittest.mock import patch
 from django.utils import timezone
 from django.test import TestCase, Client
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from apps.jobs.models import JobListing, ScreeningQuestion
 from apps.applications.models import Applicant
 from uuid import uuid4
@@ -129,6 +132,46 @@ class ApplicationSubmissionIntegrationTest(TestCase):
         self.assertEqual(answer.question, self.screening_question)
         self.assertEqual(answer.answer_text, 'I have 3 years of experience')
 
+    @patch('apps.applications.serializers.validate_email', side_effect=lambda email: email)
+    def test_submit_application_loads_questions_in_bulk(self, mock_validate_email):
+        """Test screening questions are not fetched once per answer"""
+        second_question = ScreeningQuestion.objects.create(
+            job_listing=self.job_listing,
+            question_text='Why do you want this job?',
+            question_type='TEXT',
+            required=False
+        )
+        data = {
+            'job_listing_id': str(self.job_listing.id),
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john.doe@gmail.com',
+            'phone': '+12025551234',
+            'country_code': 'US',
+            'resume': self.create_valid_resume(),
+            'screening_answers': json.dumps([
+                {
+                    'question_id': str(self.screening_question.id),
+                    'answer_text': 'I have 3 years of experience'
+                },
+                {
+                    'question_id': str(second_question.id),
+                    'answer_text': 'I enjoy building Django applications'
+                }
+            ])
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/applications/', data, format='multipart')
+
+        self.assertEqual(response.status_code, 201)
+        question_selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "jobs_screeningquestion"' in query['sql']
+        ]
+        # One bulk lookup for the answers and one prefetch with the job listing
+        self.assertEqual(len(question_selects), 2)
+
     def test_submit_application_inactive_job(self):
         """Test application submission to inactive job"""
         self.job_listing.status = 'Inactive'
@@ -223,6 +266,56 @@ class ApplicationSubmissionIntegrationTest(TestCase):
         self.assertIn('details', response.data)
         self.assertIn('email', response.data['details'])
 
+    @patch('apps.applications.serializers.validate_email', side_effect=lambda email: email)
+    def test_submit_application_answer_from_other_job(self, mock_validate_email):
+        """Test answers to another job's questions are rejected even without required questions"""
+        self.screening_question.required = False
+        self.screening_question.save()
+
+        other_job = JobListing.objects.create(
+            title='Other Developer',
+            description='Other job description',
+            required_skills=['Go'],
+            required_experience=2,
+            job_level='Entry',
+            start_date=timezone.now(),
+            expiration_date=timezone.now() + timedelta(days=30),
+            status='Active',
+            created_by=self.user
+        )
+        other_question = ScreeningQuestion.objects.create(
+            job_listing=other_job,
+            question_text='Why this team?',
+            question_type='TEXT',
+            required=False
+        )
+
+        data = {
+            'job_listing_id': str(self.job_listing.id),
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john.doe@gmail.com',
+            'phone': '+12025551234',
+            'country_code': 'US',
+            'resume': self.create_valid_resume(),
+            'screening_answers': json.dumps([
+                {
+                    'question_id': str(other_question.id),
+                    'answer_text': 'I like the product a lot'
+                }
+            ])
+        }
+
+        response = self.client.post(
+            '/api/applications/',
+            data,
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('screening_answers', response.data['details'])
+        self.assertEqual(Applicant.objects.count(), 0)
+
 
 if __name__ == '__main__':
     import unittest
@@ -3,10 +3,12 @@ Unit Tests for Duplication Detection
 """
 
 import unittest
+from unittest.mock import patch
 from datetime import timedelta
 from django.utils import timezone
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from apps.applications.models import Applicant
 from apps.jobs.models import JobListing
 from services.duplication_service import DuplicationService
@@ -19,6 +21,7 @@ class DuplicationServiceTest(TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
+        cache.clear()
         self.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
@@ -129,6 +132,115 @@ class DuplicationServiceTest(TestCase):
         )
         self.assertFalse(is_duplicate)
 
+    def test_check_duplicates_bulk_flags_each_match(self):
+        """Test bulk check reports which fields are duplicated"""
+        duplicates = DuplicationService.check_duplicates_bulk(
+            self.job_listing,
+            email='JOHN@example.com',
+            phone='+12025559999',
+            file_hash='abc123def456'
+        )
+        self.assertEqual(duplicates, {'email': True, 'phone': False, 'resume': True})
+
+    def test_check_duplicates_bulk_no_match(self):
+        """Test bulk check with no matching fields"""
+        duplicates = DuplicationService.check_duplicates_bulk(
+            self.job_listing,
+            email='different@example.com',
+            phone='+12025559999'
+        )
+        self.assertEqual(duplicates, {'email': False, 'phone': False, 'resume': False})
+
+    def test_check_duplicates_bulk_single_query(self):
+        """Test bulk check issues one query for all fields"""
+        with self.assertNumQueries(1):
+            DuplicationService.check_duplicates_bulk(
+                self.job_listing,
+                email='john@example.com',
+                phone='+12025551234',
+                file_hash='abc123def456'
+            )
+
+    @patch('services.duplication_service._negative_cache_enabled', return_value=True)
+    def test_check_duplicates_cached_reuses_negative_result(self, mock_enabled):
+        """Test a cached "not a duplicate" outcome skips the database"""
+        self.assertFalse(DuplicationService.check_duplicates_cached(
+            self.job_listing,
+            email='new@example.com',
+            phone='+12025559999'
+        ))
+        with self.assertNumQueries(0):
+            self.assertFalse(DuplicationService.check_duplicates_cached(
+                self.job_listing,
+                email='NEW@example.com',
+                phone='+12025559999'
+            ))
+
+    def test_check_duplicates_cached_skips_process_local_cache(self):
+        """Test the default local-memory cache never stores negatives"""
+        self.assertFalse(DuplicationService.check_duplicates_cached(
+            self.job_listing,
+            email='new@example.com'
+        ))
+        with self.assertNumQueries(1):
+            self.assertFalse(DuplicationService.check_duplicates_cached(
+                self.job_listing,
+                email='new@example.com'
+            ))
+
+    @patch('services.duplication_service._negative_cache_enabled', return_value=True)
+    def test_check_duplicates_cached_invalidated_on_new_applicant(self, mock_enabled):
+        """Test committing a new applicant clears its cached negatives"""
+        self.assertFalse(DuplicationService.check_duplicates_cached(
+            self.job_listing,
+            email='jane@example.com'
+        ))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Applicant.objects.create(
+                job_listing=self.job_listing,
+                first_name='Jane',
+                last_name='Doe',
+                email='jane@example.com',
+                phone='+12025558888',
+                resume_file_hash='fedcba654321',
+                resume_parsed_text='Test resume content'
+            )
+            # Nothing is invalidated until the transaction commits
+            self.assertFalse(DuplicationService.check_duplicates_cached(
+                self.job_listing,
+                email='jane@example.com'
+            ))
+
+        self.assertEqual(len(callbacks), 1)
+
+        self.assertTrue(DuplicationService.check_duplicates_cached(
+            self.job_listing,
+            email='jane@example.com'
+        ))
+
+    def test_validate_resume_header_valid_pdf(self):
+        """Test header validation accepts a PDF signature of valid size"""
+        result = DuplicationService.validate_resume_header(
+            b'%PDF',
+            'resume.pdf',
+            60 * 1024
+        )
+        self.assertTrue(result['valid'])
+        self.assertEqual(result['file_extension'], 'pdf')
+        self.assertIsNone(result['file_hash'])
+
+    def test_validate_resume_header_rejects_mismatched_magic_bytes(self):
+        """Test header validation rejects content that does not match the extension"""
+        result = DuplicationService.validate_resume_header(
+            b'PK\x03\x04',
+            'resume.pdf',
+            60 * 1024
+        )
+        self.assertFalse(result['valid'])
+        self.assertFalse(result['checks']['format_valid'])
+        self.assertEqual(result['errors'][0]['code'], 'invalid_file_content')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,13 +3,14 @@ Unit Tests for Applicant and ApplicationAnswer Models
 """
 
 import unittest
+from unittest.mock import patch
 from datetime import timedelta
 from django.utils import timezone
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.contrib.auth import get_user_model
-from apps.applications.models import Applicant, ApplicationAnswer
+from apps.applications.models import Applicant, ApplicationAnswer, generate_reference_number
 from apps.jobs.models import JobListing, ScreeningQuestion
 from uuid import uuid4
 
@@ -63,7 +64,15 @@ class ApplicantModelTest(TestCase):
         applicant = Applicant.objects.create(**self.applicant_data)
         expected_str = f"John Doe - {self.job_listing.title}"
         self.assertEqual(str(applicant), expected_str)
-    
+
+    def test_applicant_str_does_not_fetch_job_listing(self):
+        """Test string representation falls back to the job id without a query"""
+        Applicant.objects.create(**self.applicant_data)
+        applicant = Applicant.objects.get(email='john.doe@example.com')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(str(applicant), f"John Doe - Job {self.job_listing.id}")
+
     def test_unique_resume_per_job_constraint(self):
         """Test that duplicate resumes are prevented per job"""
         Applicant.objects.create(**self.applicant_data)
@@ -100,6 +109,48 @@ class ApplicantModelTest(TestCase):
         with self.assertRaises(IntegrityError):
             Applicant.objects.create(**duplicate_data)
     
+    def test_generate_reference_number_format(self):
+        """Test reference numbers are XC- plus 6 uppercase alphanumerics"""
+        self.assertRegex(generate_reference_number(), r'^XC-[0-9A-Z]{6}$')
+
+        with patch('apps.applications.models.secrets.randbelow', return_value=0):
+            self.assertEqual(generate_reference_number(), 'XC-000000')
+        with patch('apps.applications.models.secrets.randbelow', return_value=36 ** 6 - 1):
+            self.assertEqual(generate_reference_number(), 'XC-ZZZZZZ')
+
+    def test_reference_number_collision_is_retried(self):
+        """Test that a reference_number collision regenerates and saves"""
+        existing = Applicant.objects.create(**self.applicant_data)
+
+        new_data = self.applicant_data.copy()
+        new_data['email'] = 'jane@example.com'
+        new_data['phone'] = '+12025559999'
+        new_data['resume_file_hash'] = 'different_hash'
+
+        with patch(
+            'apps.applications.models.generate_reference_number',
+            side_effect=[existing.reference_number, 'XC-RETRY1']
+        ):
+            applicant = Applicant.objects.create(**new_data)
+
+        self.assertEqual(applicant.reference_number, 'XC-RETRY1')
+        self.assertEqual(Applicant.objects.count(), 2)
+
+    def test_update_skips_reference_number_retry(self):
+        """Test that updating an applicant is a single UPDATE with unchanged identifiers"""
+        applicant = Applicant.objects.create(**self.applicant_data)
+        reference_number = applicant.reference_number
+        access_token = applicant.access_token
+
+        applicant.first_name = 'Johnny'
+        with self.assertNumQueries(1):
+            applicant.save(update_fields=['first_name'])
+
+        applicant.refresh_from_db()
+        self.assertEqual(applicant.first_name, 'Johnny')
+        self.assertEqual(applicant.reference_number, reference_number)
+        self.assertEqual(applicant.access_token, access_token)
+
     def test_different_jobs_allow_same_resume(self):
         """Test that same resume can be submitted for different jobs"""
         # Create first job and applicant
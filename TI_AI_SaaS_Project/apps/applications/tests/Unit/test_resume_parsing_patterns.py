@@ -5,6 +5,7 @@ Tests for confidential information filtering patterns.
 """
 
 from django.test import SimpleTestCase
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
 from services.resume_parsing_service import ResumeParserService, ConfidentialInfoFilter
 from io import BytesIO
 from docx import Document
@@ -75,6 +76,49 @@ class ResumeParserServiceDocxTableTests(SimpleTestCase):
         self.assertIn("Paragraph 1", result)
         self.assertIn("Paragraph 2", result)
 
+    def test_extract_text_from_docx_uploaded_file(self):
+        """Test extraction reads an uploaded file object without a bytes copy."""
+        doc = Document()
+        doc.add_paragraph("Uploaded paragraph")
+
+        buffer = BytesIO()
+        doc.save(buffer)
+        upload = SimpleUploadedFile('resume.docx', buffer.getvalue())
+        # Simulate an upload that has already been read, e.g. by hashing
+        upload.read()
+
+        result = ResumeParserService.extract_text_from_docx(upload)
+
+        self.assertIn("Uploaded paragraph", result)
+
+
+class ResumeParserServiceUploadedFileHashTests(SimpleTestCase):
+    """Tests for hashing uploaded files without reading them into memory."""
+
+    def test_in_memory_upload_hash_matches_content_hash(self):
+        """Test that in-memory uploads hash the same as their raw bytes."""
+        content = b'%PDF-1.4 resume content'
+        upload = SimpleUploadedFile('resume.pdf', content)
+
+        result = ResumeParserService.calculate_uploaded_file_hash(upload)
+
+        self.assertEqual(result, ResumeParserService.calculate_file_hash(content))
+        self.assertEqual(upload.tell(), 0)
+
+    def test_temporary_upload_hash_matches_content_hash(self):
+        """Test that disk-backed uploads hash the same as their raw bytes."""
+        content = b'%PDF-1.4 resume content'
+        upload = TemporaryUploadedFile('resume.pdf', 'application/pdf', len(content), None)
+        upload.write(content)
+        upload.flush()
+
+        try:
+            result = ResumeParserService.calculate_uploaded_file_hash(upload)
+        finally:
+            upload.close()
+
+        self.assertEqual(result, ResumeParserService.calculate_file_hash(content))
+
 
 class ConfidentialInfoFilterSSNTests(SimpleTestCase):
     """Tests for SSN pattern matching and redaction."""
@@ -0,0 +1,33 @@
+"""
+Unit Tests for Application Serializers
+"""
+
+import unittest
+from django.test import SimpleTestCase
+from apps.applications.serializers import ApplicantSerializer
+
+
+class CachedFieldsMixinTest(SimpleTestCase):
+    """Unit tests for per-class field caching"""
+
+    def test_each_instance_binds_its_own_fields(self):
+        """Test cached fields are cloned so instances never share field objects"""
+        first = ApplicantSerializer()
+        second = ApplicantSerializer()
+
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields['email'], second.fields['email'])
+        self.assertIs(first.fields['email'].parent, first)
+        self.assertIs(second.fields['email'].parent, second)
+
+    def test_nested_answers_use_root_context(self):
+        """Test cloned nested serializers resolve context from their own root"""
+        serializer = ApplicantSerializer(context={'questions_by_id': {}})
+
+        answers = serializer.fields['screening_answers']
+
+        self.assertIs(answers.child.context, serializer.context)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,15 +2,28 @@
 Unit Tests for Celery Email Tasks
 """
 
+import smtplib
 import unittest
+from io import BytesIO
+from uuid import uuid4
 from datetime import timedelta
+from docx import Document
 from django.utils import timezone
-from django.test import TestCase
+from unittest.mock import Mock, patch
+from django.test import TestCase, override_settings
 from django.core import mail
 from django.contrib.auth import get_user_model
-from apps.applications.models import Applicant
-from apps.jobs.models import JobListing
-from apps.applications.tasks import send_application_confirmation_email
+from django.core.files.base import ContentFile
+from apps.applications.models import Applicant, ApplicationAnswer
+from apps.jobs.models import JobListing, ScreeningQuestion
+from apps.applications.tasks import (
+    send_application_confirmation_email,
+    parse_and_redact_resume,
+    cleanup_expired_applications,
+    _can_raw_delete_applicants,
+    send_confirmation_emails_batch,
+    queue_confirmation_emails,
+)
 
 User = get_user_model()
 
@@ -61,7 +74,52 @@ class EmailTaskTest(TestCase):
         self.assertEqual(email.to, [self.applicant.email])
         self.assertIn(self.job_listing.title, email.subject)
         self.assertIn('Application Received', email.subject)
-    
+
+    def test_send_confirmation_email_query_count(self):
+        """Test the applicant and job listing are loaded in one query"""
+        # One UPDATE claiming the sent marker, one SELECT for applicant and job listing
+        with self.assertNumQueries(2):
+            send_application_confirmation_email.apply(
+                args=[str(self.applicant.id)],
+                throw=True
+            )
+
+    def test_send_confirmation_email_only_once(self):
+        """Test a repeated task does not send a second confirmation"""
+        for _ in range(2):
+            send_application_confirmation_email.apply(
+                args=[str(self.applicant.id)],
+                throw=True
+            )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.applicant.refresh_from_db()
+        self.assertIsNotNone(self.applicant.confirmation_sent_at)
+
+    def test_send_confirmation_email_skipped_when_already_claimed(self):
+        """Test a task does not send once another has claimed the confirmation"""
+        Applicant.objects.filter(id=self.applicant.id).update(confirmation_sent_at=timezone.now())
+
+        send_application_confirmation_email.apply(
+            args=[str(self.applicant.id)],
+            throw=True
+        )
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_send_confirmation_email_failure_releases_claim(self):
+        """Test a failed send clears the marker so a later attempt can send"""
+        with patch(
+            'apps.applications.tasks._send_email',
+            side_effect=smtplib.SMTPServerDisconnected()
+        ) as mock_send:
+            send_application_confirmation_email.apply(args=[str(self.applicant.id)])
+
+        # The first attempt and every retry claimed the row again
+        self.assertEqual(mock_send.call_count, send_application_confirmation_email.max_retries + 1)
+        self.applicant.refresh_from_db()
+        self.assertIsNone(self.applicant.confirmation_sent_at)
+
     def test_email_contains_applicant_name(self):
         """Test email contains applicant name"""
         send_application_confirmation_email.apply(
@@ -94,6 +152,322 @@ class EmailTaskTest(TestCase):
         self.assertEqual(len(email.alternatives), 1)
         self.assertEqual(email.alternatives[0][1], 'text/html')
 
+    def test_send_confirmation_email_reuses_worker_connection(self):
+        """Test the worker's persistent mail connection is used when present"""
+        connection = Mock()
+        connection.send_messages.return_value = 1
+
+        with patch('apps.applications.tasks._worker_mail_connection', connection):
+            send_application_confirmation_email.apply(
+                args=[str(self.applicant.id)],
+                throw=True
+            )
+
+        connection.send_messages.assert_called_once()
+        connection.close.assert_not_called()
+
+    def test_send_confirmation_email_reconnects_dropped_connection(self):
+        """Test a connection dropped by the server is reopened and the send retried"""
+        connection = Mock()
+        connection.send_messages.side_effect = [smtplib.SMTPServerDisconnected(), 1]
+
+        with patch('apps.applications.tasks._worker_mail_connection', connection):
+            send_application_confirmation_email.apply(
+                args=[str(self.applicant.id)],
+                throw=True
+            )
+
+        self.assertEqual(connection.send_messages.call_count, 2)
+        connection.close.assert_called_once()
+
+    def test_send_confirmation_emails_batch(self):
+        """Test a batch sends one email per existing applicant and skips unknown ids"""
+        second_applicant = Applicant.objects.create(
+            job_listing=self.job_listing,
+            first_name='Jane',
+            last_name='Roe',
+            email='jane@example.com',
+            phone='+12025559999',
+            resume_file_hash='second_hash',
+            resume_parsed_text='Test content'
+        )
+
+        send_confirmation_emails_batch.apply(
+            args=[[str(self.applicant.id), str(second_applicant.id), str(uuid4())]],
+            throw=True
+        )
+
+        self.assertEqual(
+            sorted(email.to[0] for email in mail.outbox),
+            ['jane@example.com', 'john@example.com']
+        )
+
+    def test_send_confirmation_emails_batch_retries_unsent(self):
+        """Test a failed send keeps delivered markers and retries only the unsent applicants"""
+        second_applicant = Applicant.objects.create(
+            job_listing=self.job_listing,
+            first_name='Jane',
+            last_name='Roe',
+            email='jane@example.com',
+            phone='+12025559999',
+            resume_file_hash='second_hash',
+            resume_parsed_text='Test content'
+        )
+
+        def send_messages(messages):
+            if messages[0].to == ['jane@example.com']:
+                raise smtplib.SMTPServerDisconnected()
+            return 1
+
+        with patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=send_messages
+        ) as mock_send:
+            send_confirmation_emails_batch.apply(
+                args=[[str(self.applicant.id), str(second_applicant.id)]]
+            )
+
+        # John is sent once; Jane is attempted by the first run and every retry
+        self.assertEqual(mock_send.call_count, 1 + send_confirmation_emails_batch.max_retries + 1)
+        self.applicant.refresh_from_db()
+        second_applicant.refresh_from_db()
+        self.assertIsNotNone(self.applicant.confirmation_sent_at)
+        self.assertIsNone(second_applicant.confirmation_sent_at)
+
+    @patch('apps.applications.tasks.CONFIRMATION_EMAIL_BATCH_SIZE', 1)
+    def test_queue_confirmation_emails_splits_into_batches(self):
+        """Test queued ids are published as one group of batches of the configured size"""
+        missing_id = uuid4()
+
+        with patch('apps.applications.tasks.group') as mock_group:
+            queue_confirmation_emails([self.applicant.id, missing_id])
+
+        signatures = list(mock_group.call_args.args[0])
+        self.assertEqual(
+            [signature.args for signature in signatures],
+            [([str(self.applicant.id)],), ([str(missing_id)],)]
+        )
+        mock_group.return_value.apply_async.assert_called_once_with()
+
+
+class ParseResumeTaskTest(TestCase):
+    """Unit tests for the resume parsing Celery task"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job_listing = JobListing.objects.create(
+            title='Test Developer',
+            description='Test job',
+            required_skills=['Python'],
+            required_experience=2,
+            job_level='Junior',
+            start_date=timezone.now(),
+            expiration_date=timezone.now() + timedelta(days=30),
+            created_by=self.user
+        )
+        self.applicant = Applicant.objects.create(
+            job_listing=self.job_listing,
+            first_name='John',
+            last_name='Doe',
+            email='john@example.com',
+            phone='+12025551234',
+            resume_file_hash='test_hash',
+            resume_parsed_text=''
+        )
+
+    def tearDown(self):
+        """Remove the stored resume file"""
+        self.applicant.resume_file.delete(save=False)
+
+    def test_parse_docx_resume(self):
+        """Test the task stores redacted text and marks the resume parsed"""
+        doc = Document()
+        doc.add_paragraph('Senior Python developer')
+        doc.add_paragraph('SSN: 123-45-6789')
+        buffer = BytesIO()
+        doc.save(buffer)
+        self.applicant.resume_file.save('resume.docx', ContentFile(buffer.getvalue()))
+
+        parse_and_redact_resume.apply(args=[str(self.applicant.id)], throw=True)
+
+        self.applicant.refresh_from_db()
+        self.assertEqual(self.applicant.parse_status, Applicant.PARSE_STATUS_PARSED)
+        self.assertIn('Senior Python developer', self.applicant.resume_parsed_text)
+        self.assertNotIn('123-45-6789', self.applicant.resume_parsed_text)
+
+    def test_parse_corrupt_resume_marks_failed(self):
+        """Test an unreadable resume marks parsing failed"""
+        self.applicant.resume_file.save('resume.pdf', ContentFile(b'%PDF-not really a pdf'))
+
+        parse_and_redact_resume.apply(args=[str(self.applicant.id)], throw=True)
+
+        self.applicant.refresh_from_db()
+        self.assertEqual(self.applicant.parse_status, Applicant.PARSE_STATUS_FAILED)
+        self.assertEqual(self.applicant.resume_parsed_text, '')
+
+    def test_parse_resume_retries_storage_error(self):
+        """Test a transient storage error is retried instead of marking the resume failed"""
+        self.applicant.resume_file.save('resume.pdf', ContentFile(b'%PDF-1.4'))
+
+        with patch(
+            'apps.applications.tasks.ResumeParserService.extract_text_from_pdf',
+            side_effect=[OSError('connection reset'), 'Senior Python developer']
+        ) as mock_extract:
+            parse_and_redact_resume.apply(args=[str(self.applicant.id)])
+
+        self.assertEqual(mock_extract.call_count, 2)
+        self.applicant.refresh_from_db()
+        self.assertEqual(self.applicant.parse_status, Applicant.PARSE_STATUS_PARSED)
+        self.assertIn('Senior Python developer', self.applicant.resume_parsed_text)
+
+    def test_parse_resume_marks_failed_after_retries(self):
+        """Test a storage error that persists marks parsing failed once retries run out"""
+        self.applicant.resume_file.save('resume.pdf', ContentFile(b'%PDF-1.4'))
+
+        with patch(
+            'apps.applications.tasks.ResumeParserService.extract_text_from_pdf',
+            side_effect=OSError('connection reset')
+        ) as mock_extract:
+            parse_and_redact_resume.apply(args=[str(self.applicant.id)])
+
+        self.assertEqual(mock_extract.call_count, parse_and_redact_resume.max_retries + 1)
+        self.applicant.refresh_from_db()
+        self.assertEqual(self.applicant.parse_status, Applicant.PARSE_STATUS_FAILED)
+
+
+class CleanupExpiredApplicationsTaskTest(TestCase):
+    """Unit tests for the data retention cleanup task"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job_listing = JobListing.objects.create(
+            title='Test Developer',
+            description='Test job',
+            required_skills=['Python'],
+            required_experience=2,
+            job_level='Junior',
+            start_date=timezone.now(),
+            expiration_date=timezone.now() + timedelta(days=30),
+            created_by=self.user
+        )
+
+    def create_applicant(self, email, phone, file_hash):
+        """Create an applicant with a stored resume file"""
+        applicant = Applicant.objects.create(
+            job_listing=self.job_listing,
+            first_name='John',
+            last_name='Doe',
+            email=email,
+            phone=phone,
+            resume_file_hash=file_hash,
+            resume_parsed_text=''
+        )
+        applicant.resume_file.save('resume.pdf', ContentFile(b'%PDF-1.4 resume'))
+        return applicant
+
+    def test_cleanup_deletes_expired_applicants_and_files(self):
+        """Test expired applicants and their resumes are removed, recent ones kept"""
+        expired = self.create_applicant('old@example.com', '+12025551234', 'old_hash')
+        Applicant.objects.filter(id=expired.id).update(
+            submitted_at=timezone.now() - timedelta(days=91)
+        )
+        recent = self.create_applicant('new@example.com', '+12025559999', 'new_hash')
+        self.addCleanup(recent.resume_file.delete, save=False)
+        storage = expired.resume_file.storage
+
+        cleanup_expired_applications.apply(throw=True)
+
+        self.assertFalse(Applicant.objects.filter(id=expired.id).exists())
+        self.assertFalse(storage.exists(expired.resume_file.name))
+        self.assertTrue(Applicant.objects.filter(id=recent.id).exists())
+        self.assertTrue(storage.exists(recent.resume_file.name))
+
+    @patch('apps.applications.tasks.CLEANUP_BATCH_DELAY', 0)
+    @patch('apps.applications.tasks.CLEANUP_BATCH_SIZE', 1)
+    def test_cleanup_processes_multiple_batches(self):
+        """Test every expired applicant is removed when they span several batches"""
+        expired_ids = []
+        for index in range(3):
+            applicant = self.create_applicant(
+                f'old{index}@example.com', f'+1202555123{index}', f'old_hash_{index}'
+            )
+            expired_ids.append(applicant.id)
+        Applicant.objects.filter(id__in=expired_ids).update(
+            submitted_at=timezone.now() - timedelta(days=91)
+        )
+        recent = self.create_applicant('new@example.com', '+12025559999', 'new_hash')
+        self.addCleanup(recent.resume_file.delete, save=False)
+
+        cleanup_expired_applications.apply(throw=True)
+
+        self.assertEqual(list(Applicant.objects.values_list('id', flat=True)), [recent.id])
+
+    def test_current_relations_allow_raw_delete(self):
+        """Test every relation to Applicant cascades with no dependents of its own"""
+        self.assertTrue(_can_raw_delete_applicants())
+
+    @override_settings(APPLICATIONS_CLEANUP_RAW_DELETE=False)
+    def test_cleanup_with_collector_delete(self):
+        """Test the signal-sending delete path removes expired applicants too"""
+        expired = self.create_applicant('old@example.com', '+12025551234', 'old_hash')
+        Applicant.objects.filter(id=expired.id).update(
+            submitted_at=timezone.now() - timedelta(days=91)
+        )
+
+        cleanup_expired_applications.apply(throw=True)
+
+        self.assertFalse(Applicant.objects.filter(id=expired.id).exists())
+
+    def test_cleanup_falls_back_when_relations_need_collector(self):
+        """Test cleanup uses QuerySet.delete() when a relation cannot be raw-deleted"""
+        expired = self.create_applicant('old@example.com', '+12025551234', 'old_hash')
+        Applicant.objects.filter(id=expired.id).update(
+            submitted_at=timezone.now() - timedelta(days=91)
+        )
+
+        with patch('apps.applications.tasks._can_raw_delete_applicants', return_value=False), \
+                patch('apps.applications.tasks._raw_delete_applicants') as mock_raw_delete:
+            cleanup_expired_applications.apply(throw=True)
+
+        mock_raw_delete.assert_not_called()
+        self.assertFalse(Applicant.objects.filter(id=expired.id).exists())
+
+    def test_cleanup_deletes_dependent_answers(self):
+        """Test answers of expired applicants are removed along with them"""
+        question = ScreeningQuestion.objects.create(
+            job_listing=self.job_listing,
+            question_text='What is your experience?',
+            question_type='TEXT',
+            required=True
+        )
+        expired = self.create_applicant('old@example.com', '+12025551234', 'old_hash')
+        Applicant.objects.filter(id=expired.id).update(
+            submitted_at=timezone.now() - timedelta(days=91)
+        )
+        recent = self.create_applicant('new@example.com', '+12025559999', 'new_hash')
+        self.addCleanup(recent.resume_file.delete, save=False)
+        for applicant in (expired, recent):
+            ApplicationAnswer.objects.create(
+                applicant=applicant,
+                question=question,
+                answer_text='Five years of Django development'
+            )
+
+        cleanup_expired_applications.apply(throw=True)
+
+        self.assertFalse(ApplicationAnswer.objects.filter(applicant_id=expired.id).exists())
+        self.assertTrue(ApplicationAnswer.objects.filter(applicant=recent).exists())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,50 @@
+"""
+Unit Tests for Application Throttle Client IP Detection
+"""
+
+import unittest
+from django.test import SimpleTestCase, RequestFactory, override_settings
+from apps.applications.throttles import (
+    ApplicationSubmissionIPThrottle,
+    ApplicationValidationIPThrottle,
+)
+
+
+class ThrottleClientIPTest(SimpleTestCase):
+    """Unit tests for trusted proxy handling in the application throttles"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.factory = RequestFactory()
+
+    def test_untrusted_remote_addr_ignores_forwarded_for(self):
+        """Test X-Forwarded-For is ignored when REMOTE_ADDR is not a trusted proxy"""
+        request = self.factory.post(
+            '/api/applications/',
+            REMOTE_ADDR='203.0.113.5',
+            HTTP_X_FORWARDED_FOR='198.51.100.7'
+        )
+        throttle = ApplicationSubmissionIPThrottle()
+        self.assertEqual(throttle._get_client_ip(request), '203.0.113.5')
+
+    def test_trusted_proxy_network_and_address(self):
+        """Test both network ranges and single addresses are trusted"""
+        throttle = ApplicationValidationIPThrottle()
+        self.assertTrue(throttle._is_trusted_proxy('10.1.2.3', ['10.0.0.0/8', '192.168.1.1']))
+        self.assertTrue(throttle._is_trusted_proxy('192.168.1.1', ['10.0.0.0/8', '192.168.1.1']))
+        self.assertFalse(throttle._is_trusted_proxy('192.168.1.2', ['10.0.0.0/8', '192.168.1.1']))
+
+    @override_settings(TRUSTED_PROXIES=['10.0.0.0/8', 'not-an-ip'])
+    def test_forwarded_for_walks_past_trusted_proxies(self):
+        """Test the rightmost untrusted address in the chain is used"""
+        request = self.factory.post(
+            '/api/applications/',
+            REMOTE_ADDR='10.0.0.1',
+            HTTP_X_FORWARDED_FOR='198.51.100.7, 10.0.0.2'
+        )
+        throttle = ApplicationSubmissionIPThrottle()
+        self.assertEqual(throttle._get_client_ip(request), '198.51.100.7')
+
+
+if __name__ == '__main__':
+    unittest.main()
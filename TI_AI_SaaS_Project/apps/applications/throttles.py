@@ -6,10 +6,27 @@ Uses Django REST Framework's throttling mechanism with custom identification.
 """
 
 import ipaddress
+from functools import lru_cache
 from django.conf import settings
 from rest_framework.throttling import SimpleRateThrottle
 
 
+@lru_cache(maxsize=8)
+def _parse_trusted_networks(trusted_proxies: tuple) -> tuple:
+    """
+    Parse trusted proxy entries into network objects once per configuration.
+
+    Single addresses become one-address networks; invalid entries are skipped.
+    """
+    networks = []
+    for proxy in trusted_proxies:
+        try:
+            networks.append(ipaddress.ip_network(proxy, strict=False))
+        except ValueError:
+            continue
+    return tuple(networks)
+
+
 class ApplicationSubmissionIPThrottle(SimpleRateThrottle):
     """
     IP-based throttle for application submission endpoint.
@@ -85,20 +102,8 @@ class ApplicationSubmissionIPThrottle(SimpleRateThrottle):
         except ValueError:
             return False
         
-        for proxy in trusted_proxies:
-            try:
-                # Check if proxy is a network (e.g., '10.0.0.0/8') or single IP
-                if '/' in proxy:
-                    network = ipaddress.ip_network(proxy, strict=False)
-                    if ip_obj in network:
-                        return True
-                else:
-                    if ip_obj == ipaddress.ip_address(proxy):
-                        return True
-            except ValueError:
-                continue
-        
-        return False
+        # Proxies may be networks (e.g., '10.0.0.0/8') or single IPs
+        return any(ip_obj in network for network in _parse_trusted_networks(tuple(trusted_proxies)))
 
 
 class ApplicationValidationIPThrottle(SimpleRateThrottle):
@@ -149,16 +154,4 @@ class ApplicationValidationIPThrottle(SimpleRateThrottle):
         except ValueError:
             return False
         
-        for proxy in trusted_proxies:
-            try:
-                if '/' in proxy:
-                    network = ipaddress.ip_network(proxy, strict=False)
-                    if ip_obj in network:
-                        return True
-                else:
-                    if ip_obj == ipaddress.ip_address(proxy):
-                        return True
-            except ValueError:
-                continue
-
-        return False
+        return any(ip_obj in network for network in _parse_trusted_networks(tuple(trusted_proxies)))
@@ -4,8 +4,9 @@ Email validation utilities.
 
 import logging
 import hashlib
+from functools import lru_cache
 from django.core.exceptions import ValidationError
-from email_validator import validate_email as email_validate, EmailNotValidError
+from email_validator import validate_email as email_validate, EmailNotValidError, caching_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,17 @@ def _mask_email(email: str) -> str:
     return f"{masked_local}@{domain}"
 
 
+@lru_cache(maxsize=1)
+def _get_dns_resolver():
+    """
+    Return a process-wide DNS resolver that caches MX lookups.
+
+    Answers are kept for their DNS TTL, so repeat submissions from the same
+    domain (gmail.com, outlook.com, ...) skip the network round trip.
+    """
+    return caching_resolver()
+
+
 def validate_email(email: str) -> str:
     """
     Validate email format and MX record.
@@ -56,7 +68,8 @@ def validate_email(email: str) -> str:
         valid = email_validate(
             email,
             check_deliverability=True,  # Check MX record
-            test_environment=False  # Set to True for testing
+            test_environment=False,  # Set to True for testing
+            dns_resolver=_get_dns_resolver()
         )
         return valid.email  # Return normalized email
     except EmailNotValidError as e:
@@ -24,6 +24,9 @@ ALLOWED_EXTENSIONS = ['pdf', 'docx']
 PDF_MAGIC_BYTES = b'%PDF'
 DOCX_MAGIC_BYTES = b'PK\x03\x04'  # ZIP signature (Docx is a ZIP file)
 
+# Number of leading bytes needed to check any supported signature
+MAGIC_BYTES_LENGTH = 4
+
 
 def validate_resume_file(file: UploadedFile) -> UploadedFile:
     """
@@ -65,8 +68,8 @@ def validate_resume_file(file: UploadedFile) -> UploadedFile:
         )
     
     # Validate magic bytes (file signature)
-    # Read only the first 4 bytes for magic byte check to avoid loading entire file into memory
-    magic_bytes = file.read(4)
+    # Read only the first bytes for magic byte check to avoid loading entire file into memory
+    magic_bytes = file.read(MAGIC_BYTES_LENGTH)
     file.seek(0)  # Reset file pointer for downstream processing
 
     if not validate_magic_bytes(magic_bytes, file_extension):
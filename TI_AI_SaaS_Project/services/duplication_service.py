@@ -9,22 +9,171 @@ Handles:
 - Contact information duplication detection (email/phone)
 """
 
+import hashlib
 import logging
 import os
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.functions import Lower
 from services.resume_parsing_service import ResumeParserService
 from apps.applications.models import Applicant
 from apps.applications.utils.file_validation import (
     validate_resume_file as validate_file_util,
+    validate_magic_bytes,
+    ALLOWED_EXTENSIONS,
+    MAGIC_BYTES_LENGTH,
     MIN_FILE_SIZE,
     MAX_FILE_SIZE,
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds a "not a duplicate" outcome is cached for the validation endpoints
+DUPLICATE_CACHE_TIMEOUT = 30
+
+# Cache backends that live inside one process; a negative cached there could
+# not be cleared by a submission handled in another worker
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def _negative_cache_enabled() -> bool:
+    """Return True when the default cache is shared between worker processes."""
+    return settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
 
 class DuplicationService:
     """Service for detecting duplicate applications."""
 
+    @staticmethod
+    def check_duplicates_bulk(job_listing, email: str = None, phone: str = None, file_hash: str = None) -> dict:
+        """
+        Check email, phone and resume hash for duplicates in a single query.
+
+        Args:
+            job_listing: JobListing instance
+            email: Email address (compared case-insensitively)
+            phone: Phone number in E.164 format
+            file_hash: SHA-256 hash of resume file
+
+        Returns:
+            Dictionary with 'email', 'phone' and 'resume' duplicate flags
+        """
+        duplicates = {'email': False, 'phone': False, 'resume': False}
+
+        email_lower = email.lower() if email else None
+        conditions = Q()
+        if email_lower:
+            conditions |= Q(email_lower=email_lower)
+        if phone:
+            conditions |= Q(phone=phone)
+        if file_hash:
+            conditions |= Q(resume_file_hash=file_hash)
+        if not conditions:
+            return duplicates
+
+        matches = Applicant.objects.annotate(
+            email_lower=Lower('email')
+        ).filter(
+            conditions,
+            job_listing=job_listing
+        ).values_list('email_lower', 'phone', 'resume_file_hash')
+
+        for match_email, match_phone, match_hash in matches:
+            duplicates['email'] = duplicates['email'] or (email_lower is not None and match_email == email_lower)
+            duplicates['phone'] = duplicates['phone'] or (phone is not None and match_phone == phone)
+            duplicates['resume'] = duplicates['resume'] or (file_hash is not None and match_hash == file_hash)
+
+        return duplicates
+
+    @staticmethod
+    def _duplicate_cache_keys(job_listing_id, email: str = None, phone: str = None, file_hash: str = None) -> dict:
+        """
+        Build per-field cache keys for the negative duplicate cache.
+
+        Values are hashed so no contact details are stored in the keys.
+        """
+        values = {
+            'email': email.lower() if email else None,
+            'phone': phone,
+            'resume': file_hash,
+        }
+        return {
+            field: 'applications:dup:{}:{}:{}'.format(
+                job_listing_id, field, hashlib.sha256(value.encode()).hexdigest()[:16]
+            )
+            for field, value in values.items()
+            if value
+        }
+
+    @staticmethod
+    def check_duplicates_cached(job_listing, email: str = None, phone: str = None, file_hash: str = None) -> bool:
+        """
+        Check for duplicates, caching "not a duplicate" outcomes per field.
+
+        Used by the validation endpoints, which are called repeatedly while a
+        form is filled in. Cached negatives are cleared by
+        invalidate_duplicate_cache() once a new applicant is committed.
+        Caching is only used with a shared cache backend; with a process-local
+        cache every call runs the bulk query.
+
+        Args:
+            job_listing: JobListing instance or primary key
+            email: Email address (compared case-insensitively)
+            phone: Phone number in E.164 format
+            file_hash: SHA-256 hash of resume file
+
+        Returns:
+            True if any of the given values is a duplicate, False otherwise
+        """
+        if not _negative_cache_enabled():
+            duplicates = DuplicationService.check_duplicates_bulk(
+                job_listing, email=email, phone=phone, file_hash=file_hash
+            )
+            return any(duplicates.values())
+
+        job_listing_id = getattr(job_listing, 'pk', job_listing)
+        keys = DuplicationService._duplicate_cache_keys(
+            job_listing_id, email=email, phone=phone, file_hash=file_hash
+        )
+        if not keys:
+            return False
+
+        # Every field already known not to be a duplicate
+        if len(cache.get_many(keys.values())) == len(keys):
+            return False
+
+        duplicates = DuplicationService.check_duplicates_bulk(
+            job_listing, email=email, phone=phone, file_hash=file_hash
+        )
+        cache.set_many(
+            {key: False for field, key in keys.items() if not duplicates[field]},
+            DUPLICATE_CACHE_TIMEOUT
+        )
+        return any(duplicates.values())
+
+    @staticmethod
+    def invalidate_duplicate_cache(applicant) -> None:
+        """
+        Drop cached "not a duplicate" outcomes for an applicant's email, phone and resume.
+
+        Args:
+            applicant: Applicant instance that was saved
+        """
+        if not _negative_cache_enabled():
+            return
+
+        keys = DuplicationService._duplicate_cache_keys(
+            applicant.job_listing_id,
+            email=applicant.email,
+            phone=applicant.phone,
+            file_hash=applicant.resume_file_hash
+        )
+        cache.delete_many(keys.values())
+
     @staticmethod
     def check_resume_duplicate(job_listing, file_hash: str) -> bool:
         """
@@ -54,9 +203,12 @@ class DuplicationService:
         Returns:
             True if duplicate found, False otherwise
         """
-        return Applicant.objects.filter(
+        # Compare on LOWER(email) so the lookup can use app_job_email_lower_idx
+        return Applicant.objects.annotate(
+            email_lower=Lower('email')
+        ).filter(
             job_listing=job_listing,
-            email__iexact=email  # Case-insensitive comparison
+            email_lower=email.lower()
         ).exists()
 
     @staticmethod
@@ -102,6 +254,47 @@ class DuplicationService:
             Duplicate checking is performed separately via check_resume_duplicate()
             using the file_hash returned in this result.
         """
+        # Early guard: Validate file_content is not None and is bytes
+        if file_content is None or not isinstance(file_content, (bytes, bytearray)):
+            return {
+                'valid': False,
+                'checks': {
+                    'format_valid': True,
+                    'size_valid': True,
+                },
+                'errors': [{
+                    'field': 'resume',
+                    'code': 'invalid_file_content',
+                    'message': 'Invalid file content. Please upload a valid file.'
+                }],
+                'file_hash': None,
+                'file_extension': None
+            }
+
+        result = DuplicationService.validate_resume_header(
+            file_content[:MAGIC_BYTES_LENGTH], filename, len(file_content)
+        )
+
+        # Calculate file hash
+        result['file_hash'] = ResumeParserService.calculate_file_hash(file_content)
+
+        return result
+
+    @staticmethod
+    def validate_resume_header(header: bytes, filename: str, file_size: int) -> dict:
+        """
+        Validate resume size, extension and magic bytes without the full content.
+
+        Lets callers reject bad uploads after reading only the first few bytes.
+
+        Args:
+            header: Leading bytes of the file (at least 4 bytes for magic checks)
+            filename: Original filename
+            file_size: Total file size in bytes
+
+        Returns:
+            Same structure as validate_resume_file(), with 'file_hash' left as None
+        """
         result = {
             'valid': True,
             'checks': {
@@ -113,26 +306,11 @@ class DuplicationService:
             'file_extension': None
         }
 
-        # Early guard: Validate file_content is not None and is bytes
-        if file_content is None or not isinstance(file_content, (bytes, bytearray)):
-            result['valid'] = False
-            result['errors'].append({
-                'field': 'resume',
-                'code': 'invalid_file_content',
-                'message': 'Invalid file content. Please upload a valid file.'
-            })
-            return result
-
         # Get file extension using robust method
         file_extension = os.path.splitext(filename)[1].lstrip('.').lower() if filename else ''
         result['file_extension'] = file_extension
 
-        # Calculate file hash
-        file_hash = ResumeParserService.calculate_file_hash(file_content)
-        result['file_hash'] = file_hash
-
         # Check file size
-        file_size = len(file_content)
         if file_size < MIN_FILE_SIZE:
             result['valid'] = False
             result['checks']['size_valid'] = False
@@ -152,7 +330,7 @@ class DuplicationService:
             })
 
         # Check file format (extension)
-        if file_extension not in ['pdf', 'docx']:
+        if file_extension not in ALLOWED_EXTENSIONS:
             result['valid'] = False
             result['checks']['format_valid'] = False
             result['errors'].append({
@@ -162,15 +340,13 @@ class DuplicationService:
             })
 
         # Check magic bytes if extension is valid
-        if file_extension in ['pdf', 'docx']:
-            from apps.applications.utils.file_validation import validate_magic_bytes
-            if not validate_magic_bytes(file_content, file_extension):
-                result['valid'] = False
-                result['checks']['format_valid'] = False
-                result['errors'].append({
-                    'field': 'resume',
-                    'code': 'invalid_file_content',
-                    'message': 'File content does not match extension. Please upload a valid PDF or DOCX file.'
-                })
+        elif not validate_magic_bytes(header, file_extension):
+            result['valid'] = False
+            result['checks']['format_valid'] = False
+            result['errors'].append({
+                'field': 'resume',
+                'code': 'invalid_file_content',
+                'message': 'File content does not match extension. Please upload a valid PDF or DOCX file.'
+            })
 
         return result
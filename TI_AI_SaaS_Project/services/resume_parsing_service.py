@@ -11,6 +11,7 @@ This service handles:
 
 import re
 import hashlib
+from typing import BinaryIO, Union
 from pypdf import PdfReader
 from docx import Document
 from io import BytesIO
@@ -23,17 +24,25 @@ class ResumeParserService:
     """
     
     @staticmethod
-    def extract_text_from_pdf(file_content: bytes) -> str:
+    def _as_stream(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Wrap raw bytes in a stream; seekable file objects are used as-is."""
+        if isinstance(file_content, (bytes, bytearray)):
+            return BytesIO(file_content)
+        file_content.seek(0)
+        return file_content
+
+    @staticmethod
+    def extract_text_from_pdf(file_content: Union[bytes, BinaryIO]) -> str:
         """
         Extract text from a PDF file.
         
         Args:
-            file_content: Raw bytes of the PDF file
+            file_content: Raw bytes of the PDF file, or a seekable file object
             
         Returns:
             Extracted text content
         """
-        reader = PdfReader(BytesIO(file_content))
+        reader = PdfReader(ResumeParserService._as_stream(file_content))
         text = ""
         for page in reader.pages:
             page_text = page.extract_text()
@@ -42,17 +51,17 @@ class ResumeParserService:
         return text.strip()
     
     @staticmethod
-    def extract_text_from_docx(file_content: bytes) -> str:
+    def extract_text_from_docx(file_content: Union[bytes, BinaryIO]) -> str:
         """
         Extract text from a Docx file.
 
         Args:
-            file_content: Raw bytes of the Docx file
+            file_content: Raw bytes of the Docx file, or a seekable file object
 
         Returns:
             Extracted text content
         """
-        doc = Document(BytesIO(file_content))
+        doc = Document(ResumeParserService._as_stream(file_content))
         text = ""
         for paragraph in doc.paragraphs:
             if paragraph.text.strip():
@@ -82,6 +91,29 @@ class ResumeParserService:
         """
         return hashlib.sha256(file_content).hexdigest()
 
+    @staticmethod
+    def calculate_uploaded_file_hash(uploaded_file) -> str:
+        """
+        Calculate SHA-256 hash of an uploaded file without reading it into memory.
+
+        Disk-backed uploads are hashed straight from their temporary file;
+        in-memory uploads are hashed from their underlying buffer.
+
+        Args:
+            uploaded_file: Django UploadedFile instance
+
+        Returns:
+            Hexadecimal hash string (64 characters)
+        """
+        if hasattr(uploaded_file, 'temporary_file_path'):
+            with open(uploaded_file.temporary_file_path(), 'rb') as f:
+                digest = hashlib.file_digest(f, 'sha256')
+        else:
+            uploaded_file.seek(0)
+            digest = hashlib.file_digest(uploaded_file.file, 'sha256')
+        uploaded_file.seek(0)
+        return digest.hexdigest()
+
 
 class ConfidentialInfoFilter:
     """
@@ -207,6 +239,16 @@ class ConfidentialInfoFilter:
 
     # Combined address pattern (US or Canadian)
     ADDRESS_PATTERN = r'(?:' + US_ADDRESS_PATTERN + r'|' + CA_ADDRESS_PATTERN + r')'
+
+    # Patterns compiled once at class load rather than looked up per redaction
+    _EMAIL_RE = re.compile(EMAIL_PATTERN, re.IGNORECASE)
+    _PHONE_RE = re.compile(PHONE_PATTERN, re.IGNORECASE)
+    _PHONE_LETTERS_RE = re.compile(r'[A-Za-z]')
+    _SSN_RE = re.compile(SSN_PATTERN)
+    _DOB_RE = re.compile(DOB_PATTERN, re.IGNORECASE)
+    _PO_BOX_RE = re.compile(PO_BOX_PATTERN, re.IGNORECASE)
+    _RURAL_ROUTE_RE = re.compile(RURAL_ROUTE_PATTERN, re.IGNORECASE)
+    _ADDRESS_RE = re.compile(ADDRESS_PATTERN, re.IGNORECASE)
     
     @classmethod
     def redact(cls, text: str) -> str:
@@ -242,7 +284,7 @@ class ConfidentialInfoFilter:
     @classmethod
     def _redact_emails(cls, text: str) -> str:
         """Redact email addresses."""
-        return re.sub(cls.EMAIL_PATTERN, '[EMAIL_REDACTED]', text, flags=re.IGNORECASE)
+        return cls._EMAIL_RE.sub('[EMAIL_REDACTED]', text)
     
     @classmethod
     def _redact_phones(cls, text: str) -> str:
@@ -267,7 +309,7 @@ class ConfidentialInfoFilter:
             phone_str = match.group(0)
 
             # For alphanumeric numbers (1-800-FLOWERS), redact directly
-            if re.search(r'[A-Za-z]', phone_str):
+            if cls._PHONE_LETTERS_RE.search(phone_str):
                 return '[PHONE_REDACTED]'
 
             # Validate with phonenumbers library
@@ -292,17 +334,17 @@ class ConfidentialInfoFilter:
             # If validation fails, return original string
             return phone_str
 
-        return re.sub(cls.PHONE_PATTERN, replace_phone, text, flags=re.IGNORECASE)
+        return cls._PHONE_RE.sub(replace_phone, text)
     
     @classmethod
     def _redact_ssn(cls, text: str) -> str:
         """Redact Social Security Numbers."""
-        return re.sub(cls.SSN_PATTERN, '[SSN_REDACTED]', text)
+        return cls._SSN_RE.sub('[SSN_REDACTED]', text)
     
     @classmethod
     def _redact_dates_of_birth(cls, text: str) -> str:
         """Redact dates of birth."""
-        return re.sub(cls.DOB_PATTERN, '[DOB_REDACTED]', text, flags=re.IGNORECASE)
+        return cls._DOB_RE.sub('[DOB_REDACTED]', text)
     
     @classmethod
     def _redact_addresses(cls, text: str) -> str:
@@ -325,12 +367,12 @@ class ConfidentialInfoFilter:
             Text with addresses redacted
         """
         # Redact PO Boxes first (more specific pattern)
-        text = re.sub(cls.PO_BOX_PATTERN, '[ADDRESS_REDACTED]', text, flags=re.IGNORECASE)
+        text = cls._PO_BOX_RE.sub('[ADDRESS_REDACTED]', text)
         
         # Redact Rural Routes
-        text = re.sub(cls.RURAL_ROUTE_PATTERN, '[ADDRESS_REDACTED]', text, flags=re.IGNORECASE)
+        text = cls._RURAL_ROUTE_RE.sub('[ADDRESS_REDACTED]', text)
         
         # Redact full US and Canadian addresses
-        text = re.sub(cls.ADDRESS_PATTERN, '[ADDRESS_REDACTED]', text, flags=re.IGNORECASE)
+        text = cls._ADDRESS_RE.sub('[ADDRESS_REDACTED]', text)
         
         return text
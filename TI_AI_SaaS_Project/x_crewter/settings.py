@@ -292,6 +292,17 @@ CELERY_ACCEPT_CONTENT = ['application/json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+# Keep the broker connection warm between publishes from web workers
+CELERY_BROKER_TRANSPORT_OPTIONS = {'socket_keepalive': True}
+# Optional: set CELERY_HOUSEKEEPING_QUEUE (e.g. "housekeeping") to move the retention
+# cleanup and duplicate scan off the default queue so they never delay confirmation
+# emails. A worker must then consume it: celery -A x_crewter worker -Q housekeeping -c 1
+CELERY_HOUSEKEEPING_QUEUE = env('CELERY_HOUSEKEEPING_QUEUE', default='')
+if CELERY_HOUSEKEEPING_QUEUE:
+    CELERY_TASK_ROUTES = {
+        'apps.applications.tasks.cleanup_expired_applications': {'queue': CELERY_HOUSEKEEPING_QUEUE},
+        'apps.applications.tasks.check_duplicate_resumes': {'queue': CELERY_HOUSEKEEPING_QUEUE},
+    }
 
 # OLLAMA LLM Configuration
 OLLAMA_BASE_URL = env('OLLAMA_BASE_URL', default='http://localhost:11434')
@@ -452,6 +463,10 @@ else:
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB max
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB max
 
+# Expired application cleanup: delete rows with plain DELETE statements instead of
+# QuerySet.delete(). Set to False if anything relies on Applicant delete signals.
+APPLICATIONS_CLEANUP_RAW_DELETE = env.bool('APPLICATIONS_CLEANUP_RAW_DELETE', default=True)
+
 # Logging configuration
 LOGGING = {
     'version': 1,